@@ -1,10 +1,17 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import math
+import os
+import tempfile
+from eoq_core import INPUT_COLUMNS, OUTPUT_COLUMNS, calculate_eoq, iter_eoq_chunks
+from eoq_optimizer import constrained_eoq, optimize_quantity_discount, parse_price_tiers
+from eoq_timing import SectionTimer
+# Plotly and the analysis modules are imported inside the mode/section that uses them,
+# so a cold start only pays for what the visible section needs
+
+# Per-section wall-clock timings for the optional performance panel
+timer = SectionTimer()
 
 # Page configuration
 st.set_page_config(
@@ -17,7 +24,31 @@ st.set_page_config(
 # --- THEME SELECTION AND DYNAMIC CSS ---
 st.sidebar.header("🎨 Pengaturan Tampilan")
 theme = st.sidebar.radio("Pilih Tema Aplikasi:", ('Light', 'Dark'), key='theme')
-
+show_performance = st.sidebar.checkbox("⏱️ Tampilkan Panel Performa", value=False,
+                                       help="Menampilkan waktu eksekusi setiap bagian pada rerun saat ini")
+
+def render_performance_panel():
+    """Shows this rerun's section timings in the sidebar when the panel is enabled."""
+    if not show_performance:
+        return
+    timings = timer.as_dict()
+    with st.sidebar.expander("⏱️ Performa Rerun Ini", expanded=True):
+        df_timings = pd.DataFrame({'Bagian': list(timings), 'Waktu (ms)': list(timings.values())})
+        st.dataframe(df_timings.set_index('Bagian').style.format('{:.1f}'), use_container_width=True)
+        st.caption(f"Total skrip: {timer.total() * 1000:.1f} ms (termasuk serialisasi grafik pada bagian yang ditampilkan)")
+
+def stop_run():
+    """Ends the run early (the non single-item modes), after rendering the performance panel."""
+    render_performance_panel()
+    st.stop()
+
+@st.cache_resource
+def get_scenario_store():
+    """Opens the local scenario database once per server process."""
+    from eoq_store import ScenarioStore
+    return ScenarioStore()
+
+@st.cache_data
 def get_themed_css(theme):
     """
     Generates CSS styles based on the selected theme (Light/Dark).
@@ -126,7 +157,8 @@ def get_themed_css(theme):
         """
 
 # Inject the chosen CSS into the app
-st.markdown(get_themed_css(theme), unsafe_allow_html=True)
+with timer.section("CSS"):
+    st.markdown(get_themed_css(theme), unsafe_allow_html=True)
 plotly_template = 'plotly_dark' if theme == 'Dark' else 'plotly_white'
 
 # --- END OF THEME SECTION ---
@@ -135,6 +167,269 @@ plotly_template = 'plotly_dark' if theme == 'Dark' else 'plotly_white'
 # Main title
 st.markdown('<div class="main-header">📦 Supply Chain Management<br>Pengukuran Ongkos (Cost Measurement)</div>', unsafe_allow_html=True)
 
+# --- ANALYSIS MODE SELECTION ---
+st.sidebar.header("🗂️ Mode Analisis")
+analysis_mode = st.sidebar.radio("Pilih Mode:", ('Satu Item', 'Unggah Massal (CSV/Parquet)', 'Riwayat Penjualan (Time-Series)', 'Jaringan Multi-Eselon'), key='analysis_mode')
+
+if analysis_mode == 'Unggah Massal (CSV/Parquet)':
+    from eoq_figures import pareto_figure
+    from eoq_policies import POLICIES, compare_policies
+    from eoq_report import MIME_TYPES, REPORT_FORMATS, submit_export
+
+    st.markdown('<div class="sub-header">🗂️ Analisis Massal Multi-SKU</div>', unsafe_allow_html=True)
+    st.write("Unggah file CSV atau Parquet dengan kolom `{}` (satu baris per SKU). "
+             "File diproses per blok sehingga katalog besar tidak dimuat sekaligus ke memori.".format('`, `'.join(INPUT_COLUMNS)))
+    uploaded_file = st.file_uploader("Pilih file parameter", type=['csv', 'parquet'])
+    id_column = st.text_input("Kolom ID SKU (opsional)", value="", help="Nama kolom identitas SKU yang ikut ditampilkan pada hasil").strip() or None
+    page_size = st.sidebar.selectbox("Baris per halaman", [25, 50, 100, 500], index=1)
+    st.sidebar.subheader("🏭 Batasan Bersama")
+    space_limit = st.sidebar.number_input("Kapasitas Gudang (unit, 0 = tanpa batas)", min_value=0.0, value=0.0, step=1000.0,
+                                          help="Batas total Q seluruh SKU (Σ Q ≤ kapasitas)")
+    budget_limit = st.sidebar.number_input("Anggaran Persediaan (Rp, 0 = tanpa batas)", min_value=0.0, value=0.0, step=1_000_000.0,
+                                           help="Batas nilai pesanan seluruh SKU (Σ C × Q ≤ anggaran)")
+
+    if uploaded_file is None:
+        st.info("Belum ada file yang diunggah.")
+        stop_run()
+
+    # Keep computed results in the session so paging does not re-run the engine
+    file_format = 'parquet' if uploaded_file.name.lower().endswith('.parquet') else 'csv'
+    cache_key = (uploaded_file.file_id, id_column)
+    if st.session_state.get('bulk_key') != cache_key:
+        chunks = []
+        uploaded_file.seek(0)
+        progress = st.progress(0.0, text="Memproses file...")
+        try:
+            with timer.section("Pemrosesan File"):
+                for chunk in iter_eoq_chunks(uploaded_file, file_format, id_column=id_column):
+                    chunks.append(chunk)
+                    progress.progress(min(uploaded_file.tell() / max(uploaded_file.size, 1), 1.0), text=f"{sum(len(c) for c in chunks):,} SKU diproses")
+        except (ValueError, ImportError) as exc:
+            progress.empty()
+            st.error(f"Gagal membaca file: {exc}")
+            stop_run()
+        progress.empty()
+        st.session_state['bulk_key'] = cache_key
+        st.session_state['bulk_results'] = pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame(columns=INPUT_COLUMNS + OUTPUT_COLUMNS)
+        st.session_state['bulk_pareto'] = {}  # one figure per theme template, built on first use
+    df_bulk = st.session_state['bulk_results']
+
+    # Shared space/budget limits: multi-item EOQ with Lagrange multipliers, cached per upload and limits
+    limits = [(np.ones(len(df_bulk)), space_limit), (df_bulk['C'].to_numpy(dtype=np.float64), budget_limit)]
+    limits = [(usage, cap) for usage, cap in limits if cap > 0]
+    if limits and len(df_bulk):
+        constraint_key = (cache_key, space_limit, budget_limit)
+        if st.session_state.get('constraint_key') != constraint_key:
+            D_arr, A_arr, h_arr, C_arr, OB_arr = (df_bulk[col].to_numpy(dtype=np.float64) for col in ['D', 'A', 'h', 'C', 'OB'])
+            try:
+                Q_con, _ = constrained_eoq(D_arr, A_arr, h_arr, np.vstack([usage for usage, _ in limits]), [cap for _, cap in limits])
+            except ValueError as exc:
+                st.error(f"Gagal menghitung batasan bersama: {exc}")
+                stop_run()
+            # Items skipped by the optimizer (Q = 0) get zero ordering and holding cost
+            with np.errstate(divide='ignore', invalid='ignore'):
+                OP_con = np.where(Q_con > 0, D_arr / Q_con * A_arr, 0.0)
+                OS_con = np.where(Q_con > 0, Q_con / 2 * h_arr, 0.0)
+            st.session_state['constraint_key'] = constraint_key
+            st.session_state['bulk_constrained'] = df_bulk.assign(
+                Q_constrained=Q_con,
+                OT_constrained=OB_arr + OP_con + OS_con,
+            )
+        df_bulk = st.session_state['bulk_constrained']
+        st.markdown('<div class="info-box">🏭 <strong>Batasan bersama aktif</strong><br>Q* disesuaikan (kolom <code>Q_constrained</code>) '
+                    'agar total kapasitas/anggaran tidak terlampaui. Total ongkos dengan batasan: '
+                    f'<strong>Rp {df_bulk["OT_constrained"].sum():,.0f}</strong></div>', unsafe_allow_html=True)
+
+    n_rows = len(df_bulk)
+    b_col1, b_col2, b_col3, b_col4 = st.columns(4)
+    b_col1.markdown(f'<div class="metric-card"><h3>Jumlah SKU</h3><h2>{n_rows:,}</h2></div>', unsafe_allow_html=True)
+    b_col2.markdown(f'<div class="metric-card"><h3>Total Ongkos (OT)</h3><h2>Rp {df_bulk["OT_optimal"].sum():,.0f}</h2></div>', unsafe_allow_html=True)
+    b_col3.markdown(f'<div class="metric-card"><h3>Rata-rata Q*</h3><h2>{df_bulk["Q_optimal"].mean() if n_rows else 0:,.0f} unit</h2></div>', unsafe_allow_html=True)
+    b_col4.markdown(f'<div class="metric-card"><h3>Kondisi L ≥ T</h3><h2>{int((~df_bulk["condition_met"].astype(bool)).sum()):,} SKU</h2></div>', unsafe_allow_html=True)
+
+    n_pages = max(1, math.ceil(n_rows / page_size))
+    page = st.number_input(f"Halaman (1 - {n_pages})", min_value=1, max_value=n_pages, value=1, step=1)
+    start = (page - 1) * page_size
+    st.dataframe(df_bulk.iloc[start:start + page_size], use_container_width=True)
+    st.caption(f"Menampilkan baris {start + 1 if n_rows else 0:,} - {min(start + page_size, n_rows):,} dari {n_rows:,}")
+    if plotly_template not in st.session_state['bulk_pareto']:
+        st.session_state['bulk_pareto'][plotly_template] = pareto_figure(
+            st.session_state['bulk_results']['OT_optimal'], 'Kurva Pareto Total Ongkos per SKU', 'Kumulatif Total Ongkos (%)', plotly_template)
+    st.plotly_chart(st.session_state['bulk_pareto'][plotly_template], use_container_width=True)
+
+    # Catalog-wide total cost of each policy (deterministic demand, EPQ needs a production rate and is skipped)
+    with st.expander("⚖️ Perbandingan Kebijakan untuk Seluruh Katalog"):
+        if st.session_state.get('bulk_policy_key') != cache_key:
+            catalog_params = {col: df_bulk[col].to_numpy(dtype=np.float64) for col in INPUT_COLUMNS}
+            catalog_results = compare_policies(catalog_params, [policy for policy in POLICIES if policy.name != 'epq'])
+            st.session_state['bulk_policy_key'] = cache_key
+            st.session_state['bulk_policies'] = pd.DataFrame({
+                'Kebijakan': [policy.label for policy in POLICIES if policy.name in catalog_results],
+                'Total Ongkos (OT)': [np.nansum(catalog_results[policy.name]['OT']) for policy in POLICIES if policy.name in catalog_results],
+            }).set_index('Kebijakan')
+        st.dataframe(st.session_state['bulk_policies'].style.format('Rp {:,.0f}'), use_container_width=True)
+
+    # --- Catalog report export (background thread pool, streamed to a temporary file) ---
+    with st.expander("📤 Ekspor Laporan Katalog (HTML / Excel / PDF)"):
+        st.write("Laporan berisi ringkasan, rekomendasi, grafik Pareto dan SKU dengan ongkos terbesar, serta detail per SKU. "
+                 "Laporan dibuat di latar belakang sehingga halaman tetap dapat digunakan. Excel membutuhkan `xlsxwriter`, PDF membutuhkan `reportlab`.")
+        report_format = st.selectbox("Format laporan", REPORT_FORMATS, format_func={'html': 'HTML', 'xlsx': 'Excel (.xlsx)', 'pdf': 'PDF'}.get)
+        if st.button("📝 Buat Laporan"):
+            previous_job = st.session_state.get('report_job')
+            if previous_job is not None and previous_job['future'].done() and os.path.exists(previous_job['path']):
+                os.remove(previous_job['path'])
+            report_fd, report_path = tempfile.mkstemp(suffix=f'.{report_format}', prefix='laporan_eoq_')
+            os.close(report_fd)
+            future, progress = submit_export(df_bulk, report_path, report_format, id_column)
+            st.session_state['report_job'] = {'future': future, 'progress': progress, 'path': report_path, 'format': report_format}
+
+        report_job = st.session_state.get('report_job')
+        polling = report_job is not None and not report_job['future'].done()
+
+        # Polls the worker every second without rerunning the whole page, only while an export is running
+        @st.fragment(run_every=1.0 if polling else None)
+        def report_status():
+            if report_job is None:
+                return
+            if not report_job['future'].done():
+                stage, done, total = report_job['progress'].snapshot()
+                st.progress(report_job['progress'].fraction, text=f"{stage}: {done:,} / {total:,} SKU")
+                return
+            if polling:
+                st.rerun()  # one full rerun switches the polling interval off
+            if report_job['future'].exception() is not None:
+                st.error(f"Gagal membuat laporan: {report_job['future'].exception()}")
+            else:
+                with open(report_job['path'], 'rb') as report_file:
+                    st.download_button("⬇️ Unduh Laporan", data=report_file, file_name=f"laporan_eoq.{report_job['format']}",
+                                       mime=MIME_TYPES[report_job['format']])
+
+        report_status()
+    stop_run()
+
+if analysis_mode == 'Riwayat Penjualan (Time-Series)':
+    import plotly.graph_objects as go
+    from eoq_demand import load_daily_sales, rolling_annual_demand, update_eoq, window_demand_stats
+    from eoq_figures import line_trace
+
+    st.markdown('<div class="sub-header">📅 EOQ dari Riwayat Penjualan Harian</div>', unsafe_allow_html=True)
+    st.write("Unggah riwayat penjualan harian per SKU (CSV atau Parquet). Permintaan tahunan D dan variabilitasnya "
+             "dihitung dari jendela waktu terakhir, lalu Q*, R, dan T dihitung ulang hanya untuk SKU yang jendelanya berubah.")
+    history_file = st.file_uploader("Pilih file riwayat penjualan", type=['csv', 'parquet'], key='history_file')
+    h_col1, h_col2, h_col3, h_col4 = st.columns(4)
+    sku_column = h_col1.text_input("Kolom SKU", value="sku")
+    date_column = h_col2.text_input("Kolom Tanggal", value="date")
+    qty_column = h_col3.text_input("Kolom Kuantitas", value="qty")
+    window_days = h_col4.number_input("Jendela (hari)", min_value=7, max_value=3650, value=365, step=7)
+
+    st.sidebar.subheader("🔧 Parameter Biaya (semua SKU)")
+    ts_params = {
+        'C': st.sidebar.number_input("C - Harga Beli per Unit (Rp)", min_value=0.01, value=10000.0, step=100.0, key='ts_C'),
+        'A': st.sidebar.number_input("A - Ongkos Tetap per Pemesanan (Rp)", min_value=0.01, value=50000.0, step=1000.0, key='ts_A'),
+        'h': st.sidebar.number_input("h - Ongkos Penyimpanan per Unit per Tahun (Rp)", min_value=0.01, value=2000.0, step=100.0, key='ts_h'),
+        'L': st.sidebar.number_input("L - Lead Time (tahun)", min_value=0.001, value=0.1, step=0.01, format="%.3f", key='ts_L'),
+    }
+    ts_page_size = st.sidebar.selectbox("Baris per halaman", [25, 50, 100, 500], index=1, key='ts_page_size')
+
+    if history_file is None:
+        st.info("Belum ada file yang diunggah.")
+        stop_run()
+
+    # The reduced daily history is kept per upload; EOQ results are updated incrementally
+    history_key = (history_file.file_id, sku_column, date_column, qty_column)
+    if st.session_state.get('history_key') != history_key:
+        history_file.seek(0)
+        history_format = 'parquet' if history_file.name.lower().endswith('.parquet') else 'csv'
+        try:
+            with st.spinner("Membaca riwayat penjualan..."):
+                st.session_state['history_daily'] = load_daily_sales(history_file, history_format, sku_column, date_column, qty_column)
+        except (ValueError, KeyError, ImportError) as exc:
+            st.error(f"Gagal membaca file: {exc}")
+            stop_run()
+        st.session_state['history_key'] = history_key
+        # Results of the previous upload must not be reused as the baseline for this one
+        st.session_state.pop('history_results', None)
+    daily_sales = st.session_state['history_daily']
+    if daily_sales.empty:
+        st.warning("File tidak berisi data penjualan.")
+        stop_run()
+
+    with timer.section("Permintaan & EOQ"):
+        demand_stats = window_demand_stats(daily_sales, window_days=int(window_days))
+        ts_results, changed_skus = update_eoq(demand_stats, ts_params, st.session_state.get('history_results'))
+    st.session_state['history_results'] = ts_results
+
+    t_col1, t_col2, t_col3, t_col4 = st.columns(4)
+    t_col1.markdown(f'<div class="metric-card"><h3>Jumlah SKU</h3><h2>{len(ts_results):,}</h2></div>', unsafe_allow_html=True)
+    t_col2.markdown(f'<div class="metric-card"><h3>Dihitung Ulang</h3><h2>{len(changed_skus):,} SKU</h2></div>', unsafe_allow_html=True)
+    t_col3.markdown(f'<div class="metric-card"><h3>Total Ongkos (OT)</h3><h2>Rp {ts_results["OT_optimal"].sum():,.0f}</h2></div>', unsafe_allow_html=True)
+    t_col4.markdown(f'<div class="metric-card"><h3>Data Hingga</h3><h2>{demand_stats.attrs["as_of"]:%d-%m-%Y}</h2></div>', unsafe_allow_html=True)
+
+    ts_columns = ['D', 'demand_std_annual', 'active_days'] + OUTPUT_COLUMNS
+    n_pages = max(1, math.ceil(len(ts_results) / ts_page_size))
+    page = st.number_input(f"Halaman (1 - {n_pages})", min_value=1, max_value=n_pages, value=1, step=1, key='ts_page')
+    start = (page - 1) * ts_page_size
+    st.dataframe(ts_results[ts_columns].iloc[start:start + ts_page_size], use_container_width=True)
+
+    selected_sku = st.selectbox("Lihat tren permintaan SKU", ts_results.index[:10_000])
+    trend = rolling_annual_demand(daily_sales, selected_sku, window_days=int(window_days))
+    fig_trend = go.Figure()
+    fig_trend.add_trace(line_trace(trend.index, trend['D'].to_numpy(), mode='lines', name='D tahunan (rolling)'))
+    fig_trend.add_trace(line_trace(trend.index, trend['demand_std_annual'].to_numpy(), mode='lines', name='Std. deviasi tahunan'))
+    fig_trend.update_layout(title=f"Permintaan Tahunan Bergulir ({int(window_days)} hari) - {selected_sku}",
+                            xaxis_title='Tanggal', yaxis_title='Unit / tahun', template=plotly_template)
+    st.plotly_chart(fig_trend, use_container_width=True)
+    stop_run()
+
+if analysis_mode == 'Jaringan Multi-Eselon':
+    from eoq_network import EDGE_COLUMNS, NODE_COLUMNS, solve_network, summarize_by_level
+
+    st.markdown('<div class="sub-header">🏬 Jaringan Multi-Eselon (Gudang → Toko)</div>', unsafe_allow_html=True)
+    st.write("Unggah tabel node dengan kolom `{}` (opsional `unit_cost`, serta `lead_time` dan `ordering_cost` untuk node yang "
+             "dipasok dari luar jaringan) dan tabel edge dengan kolom `{}` (opsional `weight`). Permintaan eselon dijumlahkan "
+             "dari toko ke gudang, lalu Q* dan titik pemesanan ulang dihitung untuk setiap node.".format(
+                 '`, `'.join(NODE_COLUMNS), '`, `'.join(EDGE_COLUMNS)))
+    n_col1, n_col2 = st.columns(2)
+    nodes_file = n_col1.file_uploader("Tabel node (CSV)", type=['csv'], key='network_nodes')
+    edges_file = n_col2.file_uploader("Tabel edge (CSV)", type=['csv'], key='network_edges')
+    net_page_size = st.sidebar.selectbox("Baris per halaman", [25, 50, 100, 500], index=1, key='net_page_size')
+
+    if nodes_file is None or edges_file is None:
+        st.info("Unggah tabel node dan tabel edge.")
+        stop_run()
+
+    # Solved once per pair of uploads; paging and reruns reuse the session copy
+    network_key = (nodes_file.file_id, edges_file.file_id)
+    if st.session_state.get('network_key') != network_key:
+        nodes_file.seek(0)
+        edges_file.seek(0)
+        try:
+            with st.spinner("Menghitung jaringan..."), timer.section("Solusi Jaringan"):
+                st.session_state['network_results'] = solve_network(pd.read_csv(nodes_file), pd.read_csv(edges_file))
+        except (ValueError, KeyError) as exc:
+            st.error(f"Gagal memproses jaringan: {exc}")
+            stop_run()
+        st.session_state['network_key'] = network_key
+    network = st.session_state['network_results']
+    levels = summarize_by_level(network)
+
+    w_col1, w_col2, w_col3, w_col4 = st.columns(4)
+    w_col1.markdown(f'<div class="metric-card"><h3>Jumlah Node</h3><h2>{len(network):,}</h2></div>', unsafe_allow_html=True)
+    w_col2.markdown(f'<div class="metric-card"><h3>Jumlah Eselon</h3><h2>{len(levels):,}</h2></div>', unsafe_allow_html=True)
+    w_col3.markdown(f'<div class="metric-card"><h3>Total Ongkos (OT)</h3><h2>Rp {network["OT_optimal"].sum():,.0f}</h2></div>', unsafe_allow_html=True)
+    w_col4.markdown(f'<div class="metric-card"><h3>Kondisi L ≥ T</h3><h2>{int((~network["condition_met"]).sum()):,} node</h2></div>', unsafe_allow_html=True)
+
+    st.subheader("📊 Ringkasan per Eselon")
+    st.dataframe(levels.rename(columns={'nodes': 'Jumlah Node', 'echelon_demand': 'Permintaan Eselon', 'order_quantity': 'Σ Q*',
+                                        'total_cost': 'Total Ongkos (Rp)'}).rename_axis('Eselon'), use_container_width=True)
+
+    n_pages = max(1, math.ceil(len(network) / net_page_size))
+    page = st.number_input(f"Halaman (1 - {n_pages})", min_value=1, max_value=n_pages, value=1, step=1, key='net_page')
+    start = (page - 1) * net_page_size
+    st.dataframe(network.iloc[start:start + net_page_size], use_container_width=True)
+    st.caption("`R` = permintaan eselon × lead time edge masuk; `echelon_reorder_point` = permintaan eselon × lead time kumulatif dari pemasok luar.")
+    stop_run()
+
 # Sidebar for inputs
 st.sidebar.header("🔧 Parameter Input")
 st.sidebar.markdown("---")
@@ -165,218 +460,403 @@ st.sidebar.markdown("---")
 st.sidebar.subheader("🎯 Opsi Analisis")
 show_sensitivity = st.sidebar.checkbox("Tampilkan Analisis Sensitivitas", value=True)
 show_comparison = st.sidebar.checkbox("Tampilkan Perbandingan Model", value=True)
+with st.sidebar.expander("⚖️ Parameter Kebijakan Alternatif"):
+    policy_sigma = st.number_input("σ Permintaan Tahunan (unit)", min_value=0.0, value=0.0, step=10.0,
+                                   help="Standar deviasi permintaan tahunan, untuk safety stock di setiap kebijakan")
+    policy_service = st.slider("Tingkat Layanan (%)", min_value=50.0, max_value=99.9, value=95.0, step=0.5, key='policy_service')
+    policy_review_days = st.number_input("Periode Review (s, S) (hari)", min_value=1, value=7, step=1)
+    policy_production = st.number_input("Laju Produksi EPQ p (unit/tahun)", min_value=0.0, value=float(D) * 2, step=100.0,
+                                        help="Harus lebih besar dari D agar EPQ layak")
 
-# Main content
-tab1, tab2, tab3, tab4, tab5 = st.tabs(["📈 Perhitungan Utama", "📊 Analisis Grafik", "🔍 Sensitivitas", "📋 Ringkasan", "📖 Panduan & Teori"])
-
-# --- Calculations ---
-if D > 0 and h > 0: # Avoid division by zero
-    R = D * L
-    Q_optimal = math.sqrt((2 * D * A) / h)
-    T_optimal = Q_optimal / D if D > 0 else 0
-    condition_met = L < T_optimal
-    OB = D * C
-    OP_optimal = (D / Q_optimal) * A if Q_optimal > 0 else 0
-    OS_optimal = (Q_optimal / 2) * h
-    OT_optimal = OB + OP_optimal + OS_optimal
-    frequency = D / Q_optimal if Q_optimal > 0 else 0
-else: # Default values if inputs are invalid
-    R, Q_optimal, T_optimal, condition_met, OB, OP_optimal, OS_optimal, OT_optimal, frequency = (0,0,0,False,0,0,0,0,0)
-
-
-with tab1:
-    col1, col2 = st.columns(2)
-
-    with col1:
-        st.markdown('<div class="sub-header">🧮 Perhitungan Model Dasar</div>', unsafe_allow_html=True)
-        st.markdown('<div class="formula-box">🔄 <strong>Reorder Point (R)</strong><br>R = D × L<br>R = {} × {} = <strong>{:.2f} unit</strong></div>'.format(D, L, R), unsafe_allow_html=True)
-        st.markdown('<div class="formula-box">📦 <strong>Ukuran Pesanan Optimal (Q*)</strong><br>Q* = √(2DA/h)<br>Q* = √(2×{}×{}/{}) = <strong>{:.2f} unit</strong></div>'.format(D, A, h, Q_optimal), unsafe_allow_html=True)
-        st.markdown('<div class="formula-box">⏰ <strong>Siklus Waktu Optimal (T)</strong><br>T = Q/D<br>T = {:.2f}/{} = <strong>{:.4f} tahun</strong></div>'.format(Q_optimal, D, T_optimal), unsafe_allow_html=True)
-        if condition_met:
-            st.markdown('<div class="info-box">✅ <strong>Kondisi L &lt; T Terpenuhi</strong><br>L ({:.4f}) &lt; T ({:.4f})<br>Model dapat digunakan dengan aman.</div>'.format(L, T_optimal), unsafe_allow_html=True)
-        else:
-            st.markdown('<div class="warning-box">⚠️ <strong>Kondisi L ≥ T</strong><br>L ({:.4f}) ≥ T ({:.4f})<br>Perlu pertimbangan Safety Stock!</div>'.format(L, T_optimal), unsafe_allow_html=True)
-
-    with col2:
-        st.markdown('<div class="sub-header">💰 Analisis Biaya</div>', unsafe_allow_html=True)
-        st.markdown('<div class="formula-box">🛒 <strong>Ongkos Pembelian (OB)</strong><br>OB = D × C<br>OB = {} × {} = <strong>Rp {:,.2f}</strong></div>'.format(D, C, OB), unsafe_allow_html=True)
-        st.markdown('<div class="formula-box">📋 <strong>Ongkos Pemesanan (OP)</strong><br>OP = (D/Q) × A<br>OP = ({}/{:.2f}) × {} = <strong>Rp {:,.2f}</strong></div>'.format(D, Q_optimal, A, OP_optimal), unsafe_allow_html=True)
-        st.markdown('<div class="formula-box">🏪 <strong>Ongkos Penyimpanan (OS)</strong><br>OS = (Q/2) × h<br>OS = ({:.2f}/2) × {} = <strong>Rp {:,.2f}</strong></div>'.format(Q_optimal, h, OS_optimal), unsafe_allow_html=True)
-        st.markdown('<div class="formula-box" style="background-color: #4CAF50; color: white;">💸 <strong>Total Ongkos (OT)</strong><br>OT = OB+OP+OS<br>OT = <strong>Rp {:,.2f}</strong></div>'.format(OT_optimal), unsafe_allow_html=True)
-        st.markdown('<div class="info-box">🔄 <strong>Frekuensi Pemesanan</strong><br>{:.2f} kali per tahun<br>(Setiap {:.1f} hari sekali)</div>'.format(frequency, 365/frequency if frequency > 0 else 0), unsafe_allow_html=True)
-
-    st.markdown('<div class="sub-header">📊 Ringkasan Hasil Utama</div>', unsafe_allow_html=True)
-    m_col1, m_col2, m_col3, m_col4 = st.columns(4)
-    m_col1.markdown(f'<div class="metric-card"><h3>Q* Optimal</h3><h2>{Q_optimal:.0f} unit</h2></div>', unsafe_allow_html=True)
-    m_col2.markdown(f'<div class="metric-card"><h3>Reorder Point (R)</h3><h2>{R:.0f} unit</h2></div>', unsafe_allow_html=True)
-    m_col3.markdown(f'<div class="metric-card"><h3>Total Ongkos (OT)</h3><h2>Rp {OT_optimal:,.0f}</h2></div>', unsafe_allow_html=True)
-    m_col4.markdown(f'<div class="metric-card"><h3>Frekuensi</h3><h2>{frequency:.1f}x / tahun</h2></div>', unsafe_allow_html=True)
-
-with tab2:
-    st.markdown('<div class="sub-header">📊 Visualisasi Analisis Biaya</div>', unsafe_allow_html=True)
-    Q_range = np.linspace(max(1, Q_optimal * 0.2), Q_optimal * 3, 100)
-    OP_range = (D / Q_range) * A
-    OS_range = (Q_range / 2) * h
-    Total_Variable_Cost_range = OP_range + OS_range
-    
-    fig = go.Figure()
-    fig.add_trace(go.Scatter(x=Q_range, y=OP_range, mode='lines', name='Ongkos Pemesanan (OP)'))
-    fig.add_trace(go.Scatter(x=Q_range, y=OS_range, mode='lines', name='Ongkos Penyimpanan (OS)'))
-    fig.add_trace(go.Scatter(x=Q_range, y=Total_Variable_Cost_range, mode='lines', name='Total Ongkos Variabel (OP+OS)', line=dict(width=4)))
-    fig.add_vline(x=Q_optimal, line_width=2, line_dash="dash", line_color="red", annotation_text=f"Q* Optimal: {Q_optimal:.0f}")
-    
-    fig.update_layout(title='Kurva Biaya Variabel vs Ukuran Pesanan', xaxis_title='Ukuran Pesanan (Q)', yaxis_title='Biaya (Rp)', hovermode='x unified', template=plotly_template)
-    st.plotly_chart(fig, use_container_width=True)
-    
-    col1, col2 = st.columns(2)
-    with col1:
-        cost_data = ['Ongkos Pembelian', 'Ongkos Pemesanan', 'Ongkos Penyimpanan']
-        cost_values = [OB, OP_optimal, OS_optimal]
-        fig_pie = px.pie(values=cost_values, names=cost_data, title='Komposisi Biaya Total', template=plotly_template)
-        st.plotly_chart(fig_pie, use_container_width=True)
-    with col2:
-        st.info("""
-        **Analisis Kurva Biaya:**
-        - **Ongkos Pemesanan (OP)** menurun seiring Q membesar (karena makin jarang memesan).
-        - **Ongkos Penyimpanan (OS)** naik seiring Q membesar (karena rata-rata stok lebih banyak).
-        - **Titik Optimal (Q\*)** tercapai saat kurva OP dan OS berpotongan, menghasilkan total ongkos variabel terendah.
-        """)
-
-with tab3:
-    if show_sensitivity:
-        st.markdown('<div class="sub-header">🔍 Analisis Sensitivitas</div>', unsafe_allow_html=True)
-        st.write("Analisis ini menunjukkan bagaimana Ukuran Pesanan Optimal (Q*) dan Total Ongkos (OT) berubah ketika salah satu parameter input diubah.")
-        param_choice = st.selectbox("Pilih parameter untuk dianalisis:", ["Permintaan (D)", "Ongkos Pemesanan (A)", "Ongkos Penyimpanan (h)"])
-
-        if param_choice == "Permintaan (D)":
-            D_range = np.linspace(D * 0.5, D * 2, 20)
-            Q_sens = [math.sqrt((2 * d * A) / h) for d in D_range]
-            OT_sens = [d * C + (d / q) * A + (q / 2) * h for d, q in zip(D_range, Q_sens)]
-            x_label, title_q, title_ot = "Permintaan (D)", "Q* vs Permintaan", "Total Cost vs Permintaan"
-            x_range = D_range
-        elif param_choice == "Ongkos Pemesanan (A)":
-            A_range = np.linspace(A * 0.5, A * 2, 20)
-            Q_sens = [math.sqrt((2 * D * a) / h) for a in A_range]
-            OT_sens = [D * C + (D / q) * a + (q / 2) * h for a, q in zip(A_range, Q_sens)]
-            x_label, title_q, title_ot = "Ongkos Pemesanan (A)", "Q* vs Ongkos Pemesanan", "Total Cost vs Ongkos Pemesanan"
-            x_range = A_range
-        else:
-            h_range = np.linspace(h * 0.5, h * 2, 20)
-            Q_sens = [math.sqrt((2 * D * A) / h_val) for h_val in h_range]
-            OT_sens = [D * C + (D / q) * A + (q / 2) * h_val for h_val, q in zip(h_range, Q_sens)]
-            x_label, title_q, title_ot = "Ongkos Penyimpanan (h)", "Q* vs Ongkos Penyimpanan", "Total Cost vs Ongkos Penyimpanan"
-            x_range = h_range
-
-        fig_sens = make_subplots(rows=1, cols=2, subplot_titles=(title_q, title_ot))
-        fig_sens.add_trace(go.Scatter(x=x_range, y=Q_sens, mode='lines+markers', name='Q*'), row=1, col=1)
-        fig_sens.add_trace(go.Scatter(x=x_range, y=OT_sens, mode='lines+markers', name='Total Cost'), row=1, col=2)
-        fig_sens.update_xaxes(title_text=x_label, row=1, col=1)
-        fig_sens.update_xaxes(title_text=x_label, row=1, col=2)
-        fig_sens.update_yaxes(title_text="Q* Optimal (unit)", row=1, col=1)
-        fig_sens.update_yaxes(title_text="Total Ongkos (Rp)", row=1, col=2)
-        fig_sens.update_layout(height=400, title_text=f"Analisis Sensitivitas Terhadap {param_choice}", template=plotly_template, showlegend=False)
-        st.plotly_chart(fig_sens, use_container_width=True)
-    else:
-        st.info("Centang 'Tampilkan Analisis Sensitivitas' di sidebar untuk melihat konten tab ini.")
-
-with tab4:
-    if show_comparison:
-        st.markdown('<div class="sub-header">📋 Ringkasan Lengkap Analisis</div>', unsafe_allow_html=True)
+st.sidebar.markdown("---")
+st.sidebar.subheader("💲 Diskon Kuantitas")
+use_discount = st.sidebar.checkbox("Gunakan Harga Bertingkat", value=False,
+                                   help="Harga per unit bergantung pada jumlah pesanan (price break dari supplier)")
+if use_discount:
+    discount_type = st.sidebar.radio("Jenis Diskon", ('all_units', 'incremental'),
+                                     format_func={'all_units': 'All-units', 'incremental': 'Incremental'}.get)
+    tier_text = st.sidebar.text_area("Tier Harga (batas minimum : harga per unit)",
+                                     value=f"0 : {C:.0f}\n500 : {C * 0.95:.0f}\n1000 : {C * 0.9:.0f}",
+                                     help="Satu tier per baris. Tier pertama harus dimulai dari 0.")
+
+# Main content: only the selected section is built on a rerun (st.tabs would render all five every time)
+TAB_LABELS = ["📈 Perhitungan Utama", "📊 Analisis Grafik", "🔍 Sensitivitas", "📋 Ringkasan", "📖 Panduan & Teori"]
+active_tab = st.radio("Bagian", TAB_LABELS, horizontal=True, key='active_tab', label_visibility='collapsed')
+
+# --- Calculations (memoized in eoq_core, so theme/tab changes reuse the results) ---
+with timer.section("Perhitungan"):
+    R, Q_optimal, T_optimal, condition_met, OB, OP_optimal, OS_optimal, OT_optimal, frequency = calculate_eoq(D, C, A, h, L)
+
+# With price breaks, Q* and the cost breakdown come from the tier optimizer; C becomes the average price paid
+discount = None
+C_input = C  # sidebar price, kept for saving scenarios of the base model
+if use_discount:
+    try:
+        with timer.section("Perhitungan"):
+            tier_breaks, tier_prices = parse_price_tiers(tier_text)
+            discount = optimize_quantity_discount(D, A, h, L, tier_breaks, tier_prices, discount_type)
+    except ValueError as exc:
+        st.sidebar.error(f"Tier harga tidak valid: {exc}")
+if discount is not None:
+    R, Q_optimal, T_optimal, condition_met, OB, OP_optimal, OS_optimal, OT_optimal, frequency = (
+        discount[col][0].item() for col in OUTPUT_COLUMNS)
+    C = discount['unit_price'][0].item()
+
+
+if active_tab == TAB_LABELS[0]:
+    with timer.section("Tab Perhitungan Utama"):
+        from eoq_simulation import DAYS_PER_YEAR, safety_stock_for_service_level, simulate_policy
         col1, col2 = st.columns(2)
 
         with col1:
-            st.subheader("📊 Parameter Input")
-            comparison_data = {
-                'Parameter': ['Permintaan Tahunan (D)', 'Harga Beli per Unit (C)', 'Ongkos Pemesanan (A)',
-                              'Ongkos Penyimpanan (h)', 'Lead Time (L)'],
-                'Nilai': [f'{D:,.0f} unit', f'Rp {C:,.2f}', f'Rp {A:,.2f}', f'Rp {h:,.2f}', f'{L:.3f} tahun']
-            }
-            df_params = pd.DataFrame(comparison_data)
-            st.dataframe(df_params.set_index('Parameter'), use_container_width=True)
+            st.markdown('<div class="sub-header">🧮 Perhitungan Model Dasar</div>', unsafe_allow_html=True)
+            st.markdown('<div class="formula-box">🔄 <strong>Reorder Point (R)</strong><br>R = D × L<br>R = {} × {} = <strong>{:.2f} unit</strong></div>'.format(D, L, R), unsafe_allow_html=True)
+            if discount is None:
+                st.markdown('<div class="formula-box">📦 <strong>Ukuran Pesanan Optimal (Q*)</strong><br>Q* = √(2DA/h)<br>Q* = √(2×{}×{}/{}) = <strong>{:.2f} unit</strong></div>'.format(D, A, h, Q_optimal), unsafe_allow_html=True)
+            else:
+                st.markdown('<div class="formula-box">📦 <strong>Ukuran Pesanan Optimal (Q*) dengan Diskon</strong><br>Q* = argmin OT(Q) atas semua tier<br>Tier terpilih: {} (harga rata-rata Rp {:,.2f}) → <strong>{:.2f} unit</strong></div>'.format(int(discount['tier'][0]) + 1, C, Q_optimal), unsafe_allow_html=True)
+            st.markdown('<div class="formula-box">⏰ <strong>Siklus Waktu Optimal (T)</strong><br>T = Q/D<br>T = {:.2f}/{} = <strong>{:.4f} tahun</strong></div>'.format(Q_optimal, D, T_optimal), unsafe_allow_html=True)
+            if condition_met:
+                st.markdown('<div class="info-box">✅ <strong>Kondisi L &lt; T Terpenuhi</strong><br>L ({:.4f}) &lt; T ({:.4f})<br>Model dapat digunakan dengan aman.</div>'.format(L, T_optimal), unsafe_allow_html=True)
+            else:
+                st.markdown('<div class="warning-box">⚠️ <strong>Kondisi L ≥ T</strong><br>L ({:.4f}) ≥ T ({:.4f})<br>Perlu pertimbangan Safety Stock!</div>'.format(L, T_optimal), unsafe_allow_html=True)
+
         with col2:
-            st.subheader("📈 Hasil Perhitungan")
-            hasil_data = {
-                'Metrik': ['Ukuran Pesanan Optimal (Q*)', 'Reorder Point (R)', 'Siklus Waktu (T)',
-                           'Frekuensi Pemesanan', 'Ongkos Pembelian (OB)', 'Ongkos Pemesanan (OP)',
-                           'Ongkos Penyimpanan (OS)', 'Total Ongkos (OT)'],
-                'Nilai': [f'{Q_optimal:.2f} unit', f'{R:.2f} unit', f'{T_optimal:.4f} tahun',
-                          f'{frequency:.2f} kali/tahun', f'Rp {OB:,.2f}', f'Rp {OP_optimal:,.2f}',
-                          f'Rp {OS_optimal:,.2f}', f'Rp {OT_optimal:,.2f}'],
-                'Formula': ['√(2DA/h)', 'D×L', 'Q/D', 'D/Q', 'D×C', '(D/Q)×A', '(Q/2)×h', 'OB+OP+OS']
-            }
-            df_results = pd.DataFrame(hasil_data)
-            st.dataframe(df_results.set_index('Metrik'), use_container_width=True)
+            st.markdown('<div class="sub-header">💰 Analisis Biaya</div>', unsafe_allow_html=True)
+            st.markdown('<div class="formula-box">🛒 <strong>Ongkos Pembelian (OB)</strong><br>OB = D × C<br>OB = {} × {} = <strong>Rp {:,.2f}</strong></div>'.format(D, C, OB), unsafe_allow_html=True)
+            st.markdown('<div class="formula-box">📋 <strong>Ongkos Pemesanan (OP)</strong><br>OP = (D/Q) × A<br>OP = ({}/{:.2f}) × {} = <strong>Rp {:,.2f}</strong></div>'.format(D, Q_optimal, A, OP_optimal), unsafe_allow_html=True)
+            st.markdown('<div class="formula-box">🏪 <strong>Ongkos Penyimpanan (OS)</strong><br>OS = (Q/2) × h<br>OS = ({:.2f}/2) × {} = <strong>Rp {:,.2f}</strong></div>'.format(Q_optimal, h, OS_optimal), unsafe_allow_html=True)
+            st.markdown('<div class="formula-box" style="background-color: #4CAF50; color: white;">💸 <strong>Total Ongkos (OT)</strong><br>OT = OB+OP+OS<br>OT = <strong>Rp {:,.2f}</strong></div>'.format(OT_optimal), unsafe_allow_html=True)
+            st.markdown('<div class="info-box">🔄 <strong>Frekuensi Pemesanan</strong><br>{:.2f} kali per tahun<br>(Setiap {:.1f} hari sekali)</div>'.format(frequency, 365/frequency if frequency > 0 else 0), unsafe_allow_html=True)
+
+        if discount is not None:
+            st.markdown('<div class="sub-header">💲 Evaluasi Tier Harga</div>', unsafe_allow_html=True)
+            df_tiers = pd.DataFrame({
+                'Tier': [f'Tier {i + 1}' for i in range(len(tier_breaks))],
+                'Batas Minimum (unit)': [f'{b:,.0f}' for b in tier_breaks],
+                'Harga per Unit': [f'Rp {p:,.2f}' for p in tier_prices],
+                'Total Ongkos (OT)': [f'Rp {cost:,.2f}' if np.isfinite(cost) else 'Tidak layak' for cost in discount['tier_costs'][0]],
+            })
+            st.dataframe(df_tiers.set_index('Tier'), use_container_width=True)
+
+        st.markdown('<div class="sub-header">📊 Ringkasan Hasil Utama</div>', unsafe_allow_html=True)
+        m_col1, m_col2, m_col3, m_col4 = st.columns(4)
+        m_col1.markdown(f'<div class="metric-card"><h3>Q* Optimal</h3><h2>{Q_optimal:.0f} unit</h2></div>', unsafe_allow_html=True)
+        m_col2.markdown(f'<div class="metric-card"><h3>Reorder Point (R)</h3><h2>{R:.0f} unit</h2></div>', unsafe_allow_html=True)
+        m_col3.markdown(f'<div class="metric-card"><h3>Total Ongkos (OT)</h3><h2>Rp {OT_optimal:,.0f}</h2></div>', unsafe_allow_html=True)
+        m_col4.markdown(f'<div class="metric-card"><h3>Frekuensi</h3><h2>{frequency:.1f}x / tahun</h2></div>', unsafe_allow_html=True)
+
+        # --- Monte Carlo simulation (stochastic demand & lead time) ---
+        st.markdown('<div class="sub-header">🎲 Simulasi Permintaan Stokastik (Monte Carlo)</div>', unsafe_allow_html=True)
+        with st.expander("▶️ **Simulasi Safety Stock & Tingkat Layanan**", expanded=not condition_met):
+            st.write("Simulasi menjalankan kebijakan (Q*, R) secara harian dengan permintaan dan lead time acak, "
+                     "lalu menghitung fill rate, peluang stockout, dan safety stock untuk target tingkat layanan.")
+            with st.form("simulation_form"):
+                s_col1, s_col2, s_col3 = st.columns(3)
+                demand_dist = s_col1.selectbox("Distribusi Permintaan Harian", ['normal', 'poisson'])
+                demand_cv = s_col1.number_input("Koefisien Variasi Permintaan (σ/μ)", min_value=0.0, value=0.3, step=0.05,
+                                                help="Hanya dipakai untuk distribusi normal")
+                lead_std_days = s_col2.number_input("Standar Deviasi Lead Time (hari)", min_value=0.0, value=2.0, step=0.5)
+                service_level = s_col2.slider("Target Tingkat Layanan (%)", min_value=50.0, max_value=99.9, value=95.0, step=0.5)
+                n_replications = s_col3.select_slider("Jumlah Replikasi", options=[1_000, 10_000, 50_000, 100_000], value=10_000)
+                n_sim_days = s_col3.number_input("Horizon Simulasi (hari)", min_value=30, max_value=3650, value=DAYS_PER_YEAR, step=30)
+                run_simulation = st.form_submit_button("🚀 Jalankan Simulasi")
+
+            if run_simulation and Q_optimal > 0:
+                daily_mean = D / DAYS_PER_YEAR
+                daily_std = math.sqrt(daily_mean) if demand_dist == 'poisson' else daily_mean * demand_cv
+                lead_mean_days = L * DAYS_PER_YEAR
+                safety_stock = safety_stock_for_service_level(service_level / 100, daily_mean, daily_std, lead_mean_days, lead_std_days)
+                with st.spinner("Menjalankan simulasi..."):
+                    sim_base = simulate_policy(Q_optimal, R, daily_mean, daily_std, lead_mean_days, lead_std_days,
+                                               n_replications=n_replications, n_days=int(n_sim_days), demand_dist=demand_dist)
+                    sim_ss = simulate_policy(Q_optimal, R + safety_stock, daily_mean, daily_std, lead_mean_days, lead_std_days,
+                                             n_replications=n_replications, n_days=int(n_sim_days), demand_dist=demand_dist)
+
+                st.markdown(f'<div class="info-box">🛡️ <strong>Safety Stock untuk Tingkat Layanan {service_level:.1f}%</strong><br>'
+                            f'SS = <strong>{safety_stock:,.2f} unit</strong> → Reorder Point baru R = {R:,.2f} + {safety_stock:,.2f} = '
+                            f'<strong>{R + safety_stock:,.2f} unit</strong></div>', unsafe_allow_html=True)
+                df_sim = pd.DataFrame({
+                    'Metrik': ['Fill Rate', 'Fill Rate (persentil 5%)', 'Peluang Stockout per Hari',
+                               'Peluang ≥1 Stockout dalam Horizon', 'Rata-rata Persediaan di Gudang', 'Frekuensi Pemesanan'],
+                    f'Tanpa Safety Stock (R = {R:,.0f})': [f"{sim_base['fill_rate']:.2%}", f"{sim_base['fill_rate_p5']:.2%}",
+                                                           f"{sim_base['stockout_day_probability']:.2%}", f"{sim_base['stockout_year_probability']:.2%}",
+                                                           f"{sim_base['average_on_hand']:,.1f} unit", f"{sim_base['orders_per_year']:.2f} kali/tahun"],
+                    f'Dengan Safety Stock (R = {R + safety_stock:,.0f})': [f"{sim_ss['fill_rate']:.2%}", f"{sim_ss['fill_rate_p5']:.2%}",
+                                                                          f"{sim_ss['stockout_day_probability']:.2%}", f"{sim_ss['stockout_year_probability']:.2%}",
+                                                                          f"{sim_ss['average_on_hand']:,.1f} unit", f"{sim_ss['orders_per_year']:.2f} kali/tahun"],
+                })
+                st.dataframe(df_sim.set_index('Metrik'), use_container_width=True)
+                st.caption(f"{n_replications:,} replikasi × {int(n_sim_days)} hari, permintaan {demand_dist}, backorder diperbolehkan.")
+
+if active_tab == TAB_LABELS[1]:
+    with timer.section("Tab Analisis Grafik"):
+        from eoq_figures import cost_curve_figure, cost_pie_figure
+        st.markdown('<div class="sub-header">📊 Visualisasi Analisis Biaya</div>', unsafe_allow_html=True)
+        curve_points = st.select_slider("Jumlah titik kurva", options=[100, 1_000, 10_000, 100_000], value=100,
+                                        help="Kurva padat otomatis memakai WebGL dan di-downsample (LTTB) sebelum dikirim ke browser")
+        # Figures are cached per input and theme template, so a rerun only serializes them
+        fig = cost_curve_figure(D, A, h, Q_optimal, curve_points, plotly_template)
+        st.plotly_chart(fig, use_container_width=True)
+    
+        col1, col2 = st.columns(2)
+        with col1:
+            fig_pie = cost_pie_figure(OB, OP_optimal, OS_optimal, plotly_template)
+            st.plotly_chart(fig_pie, use_container_width=True)
+        with col2:
+            st.info("""
+            **Analisis Kurva Biaya:**
+            - **Ongkos Pemesanan (OP)** menurun seiring Q membesar (karena makin jarang memesan).
+            - **Ongkos Penyimpanan (OS)** naik seiring Q membesar (karena rata-rata stok lebih banyak).
+            - **Titik Optimal (Q\*)** tercapai saat kurva OP dan OS berpotongan, menghasilkan total ongkos variabel terendah.
+            """)
+
+if active_tab == TAB_LABELS[2]:
+    with timer.section("Tab Sensitivitas"):
+        import plotly.graph_objects as go
+        from eoq_figures import sensitivity_figure
+        from eoq_sensitivity import elasticities, sensitivity_grid, spider_curves, tornado
+        if show_sensitivity:
+            st.markdown('<div class="sub-header">🔍 Analisis Sensitivitas</div>', unsafe_allow_html=True)
+            st.write("Analisis ini menunjukkan bagaimana Ukuran Pesanan Optimal (Q*) dan Total Ongkos (OT) berubah ketika salah satu parameter input diubah.")
+            param_choice = st.selectbox("Pilih parameter untuk dianalisis:", ["Permintaan (D)", "Ongkos Pemesanan (A)", "Ongkos Penyimpanan (h)"])
+
+            if param_choice == "Permintaan (D)":
+                sens_param = 'D'
+                x_label, title_q, title_ot = "Permintaan (D)", "Q* vs Permintaan", "Total Cost vs Permintaan"
+            elif param_choice == "Ongkos Pemesanan (A)":
+                sens_param = 'A'
+                x_label, title_q, title_ot = "Ongkos Pemesanan (A)", "Q* vs Ongkos Pemesanan", "Total Cost vs Ongkos Pemesanan"
+            else:
+                sens_param = 'h'
+                x_label, title_q, title_ot = "Ongkos Penyimpanan (h)", "Q* vs Ongkos Penyimpanan", "Total Cost vs Ongkos Penyimpanan"
+
+            fig_sens = sensitivity_figure(D, C, A, h, sens_param, x_label, title_q, title_ot, f"Analisis Sensitivitas Terhadap {param_choice}",
+                                          template=plotly_template)
+            st.plotly_chart(fig_sens, use_container_width=True)
+
+            # --- Multi-parameter sensitivity (broadcast grids, closed-form elasticities) ---
+            param_labels = {'D': 'Permintaan (D)', 'C': 'Harga Beli (C)', 'A': 'Ongkos Pemesanan (A)',
+                            'h': 'Ongkos Penyimpanan (h)', 'L': 'Lead Time (L)'}
+            metric_labels = {'Q_optimal': 'Q* Optimal (unit)', 'OT_optimal': 'Total Ongkos (Rp)'}
+
+            st.markdown('<div class="sub-header">🗺️ Sensitivitas Dua Parameter</div>', unsafe_allow_html=True)
+            g_col1, g_col2, g_col3, g_col4 = st.columns(4)
+            x_param = g_col1.selectbox("Sumbu X", ['D', 'A', 'h', 'C'], format_func=param_labels.get, key='grid_x')
+            y_param = g_col2.selectbox("Sumbu Y", [p for p in ['D', 'A', 'h', 'C'] if p != x_param], format_func=param_labels.get, key='grid_y')
+            grid_metric = g_col3.selectbox("Metrik", list(metric_labels), format_func=metric_labels.get, key='grid_metric')
+            grid_style = g_col4.radio("Tampilan", ('Heatmap', 'Kontur'), key='grid_style', horizontal=True)
+
+            # Axis 0 is y (rows) and axis 1 is x (columns), as expected by Heatmap/Contour
+            axis_values, grid_results = sensitivity_grid(D, C, A, h, L, axes=(y_param, x_param), n_points=200)
+            grid_trace = go.Heatmap if grid_style == 'Heatmap' else go.Contour
+            fig_grid = go.Figure(grid_trace(x=axis_values[x_param], y=axis_values[y_param], z=grid_results[grid_metric],
+                                            colorbar=dict(title=metric_labels[grid_metric])))
+            base_params = {'D': D, 'C': C, 'A': A, 'h': h, 'L': L}
+            fig_grid.add_trace(go.Scatter(x=[base_params[x_param]], y=[base_params[y_param]],
+                                          mode='markers', marker=dict(color='red', size=10, symbol='x'), name='Nilai saat ini'))
+            fig_grid.update_layout(height=500, title=f"{metric_labels[grid_metric]}: {param_labels[x_param]} × {param_labels[y_param]}",
+                                   xaxis_title=param_labels[x_param], yaxis_title=param_labels[y_param], template=plotly_template)
+            st.plotly_chart(fig_grid, use_container_width=True)
+
+            st.markdown('<div class="sub-header">🌪️ Tornado & Spider (Kelima Parameter)</div>', unsafe_allow_html=True)
+            t_col1, t_col2 = st.columns(2)
+            swing_pct = t_col1.slider("Perubahan parameter untuk tornado (±%)", min_value=5, max_value=50, value=20, step=5)
+            tornado_metric = t_col2.selectbox("Metrik tornado & spider", list(metric_labels), format_func=metric_labels.get, index=1, key='tornado_metric')
+            base_value = calculate_eoq(D, C, A, h, L)._asdict()[tornado_metric]
+
+            col1, col2 = st.columns(2)
+            with col1:
+                tornado_rows = tornado(D, C, A, h, L, swing=swing_pct / 100, metric=tornado_metric)[::-1]
+                fig_tornado = go.Figure()
+                fig_tornado.add_trace(go.Bar(y=[param_labels[p] for p, _, _ in tornado_rows], x=[low - base_value for _, low, _ in tornado_rows],
+                                             orientation='h', name=f'-{swing_pct}%'))
+                fig_tornado.add_trace(go.Bar(y=[param_labels[p] for p, _, _ in tornado_rows], x=[high - base_value for _, _, high in tornado_rows],
+                                             orientation='h', name=f'+{swing_pct}%'))
+                fig_tornado.update_layout(barmode='overlay', height=400, title=f"Tornado: Perubahan {metric_labels[tornado_metric]}",
+                                          xaxis_title="Selisih terhadap nilai dasar", template=plotly_template)
+                st.plotly_chart(fig_tornado, use_container_width=True)
+            with col2:
+                factors, spider_results = spider_curves(D, C, A, h, L, n_points=100)
+                fig_spider = go.Figure()
+                for i, param in enumerate(INPUT_COLUMNS):
+                    fig_spider.add_trace(go.Scatter(x=(factors - 1) * 100, y=spider_results[tornado_metric][i], mode='lines', name=param_labels[param]))
+                fig_spider.update_layout(height=400, title=f"Spider: {metric_labels[tornado_metric]}",
+                                         xaxis_title="Perubahan parameter (%)", yaxis_title=metric_labels[tornado_metric], template=plotly_template)
+                st.plotly_chart(fig_spider, use_container_width=True)
+
+            st.markdown('<div class="sub-header">📐 Elastisitas Analitis</div>', unsafe_allow_html=True)
+            elas = elasticities(D, C, A, h, L)
+            df_elas = pd.DataFrame({
+                'Parameter': [param_labels[p] for p in INPUT_COLUMNS],
+                '∂Q*/∂x': [float(elas[('Q_optimal', p)]['partial']) for p in INPUT_COLUMNS],
+                'Elastisitas Q*': [float(elas[('Q_optimal', p)]['elasticity']) for p in INPUT_COLUMNS],
+                '∂OT/∂x': [float(elas[('OT_optimal', p)]['partial']) for p in INPUT_COLUMNS],
+                'Elastisitas OT': [float(elas[('OT_optimal', p)]['elasticity']) for p in INPUT_COLUMNS],
+            })
+            st.dataframe(df_elas.set_index('Parameter'), use_container_width=True)
+            st.caption("Elastisitas = (x / f) × (∂f/∂x): persentase perubahan hasil untuk setiap 1% perubahan parameter.")
+        else:
+            st.info("Centang 'Tampilkan Analisis Sensitivitas' di sidebar untuk melihat konten tab ini.")
+
+if active_tab == TAB_LABELS[3]:
+    with timer.section("Tab Ringkasan"):
+        from eoq_policies import POLICIES, compare_policies
+        from eoq_simulation import DAYS_PER_YEAR
+        if show_comparison:
+            st.markdown('<div class="sub-header">📋 Ringkasan Lengkap Analisis</div>', unsafe_allow_html=True)
+            col1, col2 = st.columns(2)
+
+            with col1:
+                st.subheader("📊 Parameter Input")
+                comparison_data = {
+                    'Parameter': ['Permintaan Tahunan (D)', 'Harga Beli per Unit (C)', 'Ongkos Pemesanan (A)',
+                                  'Ongkos Penyimpanan (h)', 'Lead Time (L)'],
+                    'Nilai': [f'{D:,.0f} unit', f'Rp {C:,.2f}', f'Rp {A:,.2f}', f'Rp {h:,.2f}', f'{L:.3f} tahun']
+                }
+                df_params = pd.DataFrame(comparison_data)
+                st.dataframe(df_params.set_index('Parameter'), use_container_width=True)
+            with col2:
+                st.subheader("📈 Hasil Perhitungan")
+                hasil_data = {
+                    'Metrik': ['Ukuran Pesanan Optimal (Q*)', 'Reorder Point (R)', 'Siklus Waktu (T)',
+                               'Frekuensi Pemesanan', 'Ongkos Pembelian (OB)', 'Ongkos Pemesanan (OP)',
+                               'Ongkos Penyimpanan (OS)', 'Total Ongkos (OT)'],
+                    'Nilai': [f'{Q_optimal:.2f} unit', f'{R:.2f} unit', f'{T_optimal:.4f} tahun',
+                              f'{frequency:.2f} kali/tahun', f'Rp {OB:,.2f}', f'Rp {OP_optimal:,.2f}',
+                              f'Rp {OS_optimal:,.2f}', f'Rp {OT_optimal:,.2f}'],
+                    'Formula': ['√(2DA/h)', 'D×L', 'Q/D', 'D/Q', 'D×C', '(D/Q)×A', '(Q/2)×h', 'OB+OP+OS']
+                }
+                df_results = pd.DataFrame(hasil_data)
+                st.dataframe(df_results.set_index('Metrik'), use_container_width=True)
             
-        st.markdown('<div class="sub-header">💡 Interpretasi dan Rekomendasi</div>', unsafe_allow_html=True)
+            st.markdown('<div class="sub-header">💡 Interpretasi dan Rekomendasi</div>', unsafe_allow_html=True)
         
-        # FIXED: Using custom classes instead of st.success and st.warning
-        if condition_met:
-            success_message = f"""
-            <div class="success-box">
-                ✅ <strong>Model Valid:</strong> Kondisi L &lt; T terpenuhi ({L:.4f} &lt; {T_optimal:.4f}).
-                <br><br>
-                📋 <strong>Rekomendasi Operasional:</strong>
-                <ul>
-                    <li>Pesan sebanyak <strong>{Q_optimal:.0f} unit</strong> setiap kali pemesanan.</li>
-                    <li>Lakukan pemesanan ketika stok mencapai <strong>{R:.0f} unit</strong> (Reorder Point).</li>
-                    <li>Frekuensi pemesanan: <strong>{frequency:.1f} kali per tahun</strong> (setiap <strong>{365/frequency if frequency > 0 else 0:.0f} hari</strong>).</li>
-                    <li>Total biaya tahunan yang diharapkan: <strong>Rp {OT_optimal:,.0f}</strong>.</li>
-                </ul>
-            </div>
-            """
-            st.markdown(success_message, unsafe_allow_html=True)
+            # FIXED: Using custom classes instead of st.success and st.warning
+            if condition_met:
+                success_message = f"""
+                <div class="success-box">
+                    ✅ <strong>Model Valid:</strong> Kondisi L &lt; T terpenuhi ({L:.4f} &lt; {T_optimal:.4f}).
+                    <br><br>
+                    📋 <strong>Rekomendasi Operasional:</strong>
+                    <ul>
+                        <li>Pesan sebanyak <strong>{Q_optimal:.0f} unit</strong> setiap kali pemesanan.</li>
+                        <li>Lakukan pemesanan ketika stok mencapai <strong>{R:.0f} unit</strong> (Reorder Point).</li>
+                        <li>Frekuensi pemesanan: <strong>{frequency:.1f} kali per tahun</strong> (setiap <strong>{365/frequency if frequency > 0 else 0:.0f} hari</strong>).</li>
+                        <li>Total biaya tahunan yang diharapkan: <strong>Rp {OT_optimal:,.0f}</strong>.</li>
+                    </ul>
+                </div>
+                """
+                st.markdown(success_message, unsafe_allow_html=True)
+            else:
+                warning_message = f"""
+                <div class="warning-box">
+                    ⚠️ <strong>Perhatian:</strong> Lead Time ({L:.4f} tahun) ≥ Siklus Waktu ({T_optimal:.4f} tahun).
+                    <br><br>
+                    🛡️ <strong>Rekomendasi:</strong>
+                    <ul>
+                        <li>Pertimbangkan menambah <strong>Safety Stock</strong> untuk menghindari kehabisan stok.</li>
+                        <li>Evaluasi supplier untuk mencoba mengurangi Lead Time.</li>
+                        <li>Monitor tingkat layanan dan risiko stockout dengan lebih ketat.</li>
+                    </ul>
+                </div>
+                """
+                st.markdown(warning_message, unsafe_allow_html=True)
+
+            # --- Alternative policies: (Q, R), (R, S), (s, S), EPQ optimized side by side ---
+            st.markdown('<div class="sub-header">⚖️ Perbandingan Kebijakan Persediaan</div>', unsafe_allow_html=True)
+            policy_params = {'D': D, 'C': C, 'A': A, 'h': h, 'L': L, 'sigma': policy_sigma,
+                             'service_level': policy_service / 100, 'review_period': policy_review_days / DAYS_PER_YEAR,
+                             'production_rate': policy_production}
+            policy_results = compare_policies(policy_params)
+            policy_rows = []
+            for policy in POLICIES:
+                res = {key: float(np.asarray(value)) for key, value in policy_results[policy.name].items()}
+                settings = ', '.join(f'{key} = {res[key]:,.2f}' for key in ['Q', 'R', 'T', 'S', 's', 'max_inventory'] if key in res)
+                policy_rows.append({
+                    'Kebijakan': policy.label,
+                    'Parameter Optimal': settings,
+                    'Ongkos Pemesanan (OP)': res['OP'],
+                    'Ongkos Penyimpanan (OS)': res['OS'],
+                    'Total Ongkos (OT)': res['OT'],
+                })
+            df_policies = pd.DataFrame(policy_rows).set_index('Kebijakan')
+            st.dataframe(df_policies.style.format({col: 'Rp {:,.2f}' for col in ['Ongkos Pemesanan (OP)', 'Ongkos Penyimpanan (OS)', 'Total Ongkos (OT)']},
+                                                  na_rep='Tidak layak'), use_container_width=True)
+            st.caption("Parameter tiap kebijakan dicari dengan golden-section search. T dalam tahun; safety stock memakai σ dan tingkat layanan di sidebar.")
+
+            # --- Saved scenarios (SQLite store, results cached by parameter hash) ---
+            st.markdown('<div class="sub-header">💾 Perbandingan Skenario Tersimpan</div>', unsafe_allow_html=True)
+            store = get_scenario_store()
+            sc_col1, sc_col2 = st.columns([3, 1])
+            scenario_name = sc_col1.text_input("Nama skenario", value=f"D={D:,.0f} A={A:,.0f} h={h:,.0f}")
+            sc_col2.write("")
+            if sc_col2.button("💾 Simpan Skenario", use_container_width=True) and scenario_name.strip():
+                store.save_scenario(scenario_name.strip(), D, C_input, A, h, L)
+                st.success(f"Skenario '{scenario_name.strip()}' disimpan.")
+
+            saved_names = store.list_scenarios()
+            if saved_names:
+                selected_names = st.multiselect("Skenario yang dibandingkan", saved_names, default=saved_names[:20])
+                df_scenarios = store.load_scenarios(selected_names)
+                current = pd.DataFrame([[D, C_input, A, h, L, *calculate_eoq(D, C_input, A, h, L)]],
+                                       columns=INPUT_COLUMNS + OUTPUT_COLUMNS, index=['(Input saat ini)'])
+                df_compare = pd.concat([current, df_scenarios])
+                df_compare['condition_met'] = df_compare['condition_met'].map({True: '✅ L < T', False: '⚠️ L ≥ T'})
+                st.dataframe(df_compare.rename(columns={'Q_optimal': 'Q*', 'T_optimal': 'T', 'condition_met': 'Kondisi',
+                                                        'OP_optimal': 'OP', 'OS_optimal': 'OS', 'OT_optimal': 'OT',
+                                                        'frequency': 'Frekuensi'}),
+                             use_container_width=True)
+                st.caption(f"{len(saved_names):,} skenario tersimpan · {store.cache_size():,} hasil di cache "
+                           f"(maks. {store.max_entries:,}, entri lama dihapus otomatis).")
+                to_delete = st.selectbox("Hapus skenario", [''] + saved_names, format_func=lambda name: name or '—')
+                if to_delete and st.button("🗑️ Hapus"):
+                    store.delete_scenario(to_delete)
+                    st.rerun()
+            else:
+                st.info("Belum ada skenario tersimpan. Simpan input saat ini untuk mulai membandingkan.")
         else:
-            warning_message = f"""
-            <div class="warning-box">
-                ⚠️ <strong>Perhatian:</strong> Lead Time ({L:.4f} tahun) ≥ Siklus Waktu ({T_optimal:.4f} tahun).
-                <br><br>
-                🛡️ <strong>Rekomendasi:</strong>
-                <ul>
-                    <li>Pertimbangkan menambah <strong>Safety Stock</strong> untuk menghindari kehabisan stok.</li>
-                    <li>Evaluasi supplier untuk mencoba mengurangi Lead Time.</li>
-                    <li>Monitor tingkat layanan dan risiko stockout dengan lebih ketat.</li>
-                </ul>
-            </div>
-            """
-            st.markdown(warning_message, unsafe_allow_html=True)
-    else:
-        st.info("Centang 'Tampilkan Perbandingan Model' di sidebar untuk melihat konten tab ini.")
+            st.info("Centang 'Tampilkan Perbandingan Model' di sidebar untuk melihat konten tab ini.")
         
-with tab5:
-    st.markdown('<div class="sub-header">📖 Panduan Penggunaan & Analisis Teori</div>', unsafe_allow_html=True)
-    with st.expander("▶️ **Cara Penggunaan Aplikasi (Tutorial)**", expanded=True):
-        st.markdown("""
-        Aplikasi ini dirancang untuk menghitung ukuran pemesanan optimal dan biaya terkait dalam manajemen persediaan menggunakan model Economic Order Quantity (EOQ).
-
-        **Langkah 1: Input Parameter di Sidebar (Bagian Kiri)**
-        1.  **Pengaturan Tampilan**: Pilih tema `Light` atau `Dark`.
-        2.  **Parameter Dasar**:
-            * **D - Permintaan Tahunan**: Total unit produk yang dibutuhkan dalam satu tahun.
-            * **C - Harga Beli per Unit**: Harga beli satu unit produk (dalam Rupiah).
-            * **A - Ongkos Tetap per Pemesanan**: Biaya tetap setiap kali memesan (misal: biaya administrasi, telepon).
-            * **h - Ongkos Penyimpanan per Unit per Tahun**: Biaya menyimpan satu unit produk selama satu tahun.
-            * **L - Lead Time (tahun)**: Waktu tunggu dari pesan hingga barang datang (dalam satuan tahun).
-
-        **Langkah 2: Memahami Hasil di Setiap Tab**
-        * **📈 Perhitungan Utama**: Menampilkan hasil perhitungan inti (Q*, R, T) dan rincian semua biaya.
-        * **📊 Analisis Grafik**: Visualisasi kurva biaya untuk menemukan titik optimal dan komposisi biaya.
-        * **🔍 Sensitivitas**: Melihat bagaimana perubahan parameter input memengaruhi hasil.
-        * **📋 Ringkasan**: Tabel ringkasan semua input dan output untuk pelaporan.
-        """)
-
-    with st.expander("▶️ **Analisis Kesesuaian dengan Teori (Model EOQ)**"):
-        st.markdown("""
-        Ya, aplikasi ini **sudah sangat sesuai** dengan teori manajemen persediaan, khususnya model **Economic Order Quantity (EOQ)**.
-
-        1.  **Formula EOQ (Q\*)**: Perhitungan `Ukuran Pesanan Optimal (Q)` menggunakan formula standar EOQ: $Q^* = \\sqrt{\\frac{2DA}{h}}$. Ini adalah inti dari model yang bertujuan menyeimbangkan biaya pemesanan dan biaya penyimpanan.
-        2.  **Keseimbangan Biaya**: Teori EOQ menyatakan bahwa titik optimal (biaya terendah) tercapai ketika total biaya pemesanan tahunan sama dengan total biaya penyimpanan tahunan. Anda bisa melihat ini pada **Tab Analisis Grafik**, di mana kurva `Ongkos Pemesanan (OP)` dan `Ongkos Penyimpanan (OS)` berpotongan tepat di titik Q* optimal.
-        3.  **Reorder Point (R)**: Perhitungan $R = D \\times L$ adalah formula standar untuk menentukan titik pemesanan kembali dalam kondisi permintaan yang konstan dan diketahui, yang merupakan asumsi dasar model EOQ.
-        4.  **Peringatan (L < T)**: Aplikasi ini memberikan analisis tambahan yang cerdas dengan memeriksa apakah `Lead Time (L)` lebih kecil dari `Siklus Waktu (T)`. Jika L ≥ T, artinya pesanan berikutnya belum akan datang saat persediaan sudah habis. Peringatan untuk mempertimbangkan **Safety Stock** ini adalah penerapan praktis yang sangat baik dari teori untuk kondisi dunia nyata.
-
-        **Kesimpulan**: Aplikasi ini adalah alat analisis yang mengimplementasikan model EOQ secara akurat dan memberikan interpretasi yang relevan secara manajerial.
-        """)
+if active_tab == TAB_LABELS[4]:
+    with timer.section("Tab Panduan & Teori"):
+        st.markdown('<div class="sub-header">📖 Panduan Penggunaan & Analisis Teori</div>', unsafe_allow_html=True)
+        with st.expander("▶️ **Cara Penggunaan Aplikasi (Tutorial)**", expanded=True):
+            st.markdown("""
+            Aplikasi ini dirancang untuk menghitung ukuran pemesanan optimal dan biaya terkait dalam manajemen persediaan menggunakan model Economic Order Quantity (EOQ).
+
+            **Langkah 1: Input Parameter di Sidebar (Bagian Kiri)**
+            1.  **Pengaturan Tampilan**: Pilih tema `Light` atau `Dark`.
+            2.  **Parameter Dasar**:
+                * **D - Permintaan Tahunan**: Total unit produk yang dibutuhkan dalam satu tahun.
+                * **C - Harga Beli per Unit**: Harga beli satu unit produk (dalam Rupiah).
+                * **A - Ongkos Tetap per Pemesanan**: Biaya tetap setiap kali memesan (misal: biaya administrasi, telepon).
+                * **h - Ongkos Penyimpanan per Unit per Tahun**: Biaya menyimpan satu unit produk selama satu tahun.
+                * **L - Lead Time (tahun)**: Waktu tunggu dari pesan hingga barang datang (dalam satuan tahun).
+
+            **Langkah 2: Memahami Hasil di Setiap Tab**
+            * **📈 Perhitungan Utama**: Menampilkan hasil perhitungan inti (Q*, R, T) dan rincian semua biaya.
+            * **📊 Analisis Grafik**: Visualisasi kurva biaya untuk menemukan titik optimal dan komposisi biaya.
+            * **🔍 Sensitivitas**: Melihat bagaimana perubahan parameter input memengaruhi hasil.
+            * **📋 Ringkasan**: Tabel ringkasan semua input dan output untuk pelaporan.
+            """)
+
+        with st.expander("▶️ **Analisis Kesesuaian dengan Teori (Model EOQ)**"):
+            st.markdown("""
+            Ya, aplikasi ini **sudah sangat sesuai** dengan teori manajemen persediaan, khususnya model **Economic Order Quantity (EOQ)**.
+
+            1.  **Formula EOQ (Q\*)**: Perhitungan `Ukuran Pesanan Optimal (Q)` menggunakan formula standar EOQ: $Q^* = \\sqrt{\\frac{2DA}{h}}$. Ini adalah inti dari model yang bertujuan menyeimbangkan biaya pemesanan dan biaya penyimpanan.
+            2.  **Keseimbangan Biaya**: Teori EOQ menyatakan bahwa titik optimal (biaya terendah) tercapai ketika total biaya pemesanan tahunan sama dengan total biaya penyimpanan tahunan. Anda bisa melihat ini pada **Tab Analisis Grafik**, di mana kurva `Ongkos Pemesanan (OP)` dan `Ongkos Penyimpanan (OS)` berpotongan tepat di titik Q* optimal.
+            3.  **Reorder Point (R)**: Perhitungan $R = D \\times L$ adalah formula standar untuk menentukan titik pemesanan kembali dalam kondisi permintaan yang konstan dan diketahui, yang merupakan asumsi dasar model EOQ.
+            4.  **Peringatan (L < T)**: Aplikasi ini memberikan analisis tambahan yang cerdas dengan memeriksa apakah `Lead Time (L)` lebih kecil dari `Siklus Waktu (T)`. Jika L ≥ T, artinya pesanan berikutnya belum akan datang saat persediaan sudah habis. Peringatan untuk mempertimbangkan **Safety Stock** ini adalah penerapan praktis yang sangat baik dari teori untuk kondisi dunia nyata.
+
+            **Kesimpulan**: Aplikasi ini adalah alat analisis yang mengimplementasikan model EOQ secara akurat dan memberikan interpretasi yang relevan secara manajerial.
+            """)
 
 
 # Footer
 st.markdown("---")
 st.markdown("<div style='text-align: center; color: #888; font-size: 0.9rem;'>📦 Supply Chain Management - Pengukuran Ongkos | Kelompok 1 | Dibuat dengan Streamlit</div>", unsafe_allow_html=True)
+
+# --- PERFORMANCE PANEL (opt-in) ---
+render_performance_panel()
@@ -0,0 +1,210 @@
+"""
+Benchmark suite for the dashboard rerun path.
+
+Times the vectorized calculation core at several catalog sizes, figure
+building, and (when streamlit is installed) a full script rerun through
+Streamlit's AppTest. Results are written as JSON so runs can be compared
+to catch regressions.
+
+Examples:
+    python eoq_benchmark.py
+    python eoq_benchmark.py --sizes 1 10000 1000000 --repeat 5 -o bench.json
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+from time import perf_counter
+
+import numpy as np
+
+from eoq_core import calculate_eoq, compute_eoq_arrays
+
+APP_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'GUI_SupplyChain_Test.py')
+DEFAULT_SIZES = [1, 10_000, 1_000_000]
+
+
+def _time(func, repeat):
+    """Runs `func` `repeat` times and returns the elapsed seconds of each run."""
+    samples = []
+    for _ in range(repeat):
+        start = perf_counter()
+        func()
+        samples.append(perf_counter() - start)
+    return samples
+
+
+def _result(name, samples, **extra):
+    return {
+        'name': name,
+        'repeat': len(samples),
+        'min_ms': min(samples) * 1000,
+        'median_ms': statistics.median(samples) * 1000,
+        'mean_ms': statistics.fmean(samples) * 1000,
+        **extra,
+    }
+
+
+def random_parameters(n, seed=0):
+    """Random but realistic SKU parameters (same ranges as the sidebar defaults)."""
+    rng = np.random.default_rng(seed)
+    return (rng.uniform(100, 100_000, n), rng.uniform(1_000, 100_000, n), rng.uniform(10_000, 500_000, n),
+            rng.uniform(100, 10_000, n), rng.uniform(0.01, 0.5, n))
+
+
+def bench_core(sizes, repeat):
+    results = []
+    # The single-item path uses the memoized scalar function; time it uncached
+    samples = _time(lambda: calculate_eoq.__wrapped__(1000, 10000.0, 50000.0, 2000.0, 0.1), repeat)
+    results.append(_result('core.calculate_eoq', samples, n_skus=1))
+    for n in sizes:
+        params = random_parameters(n)
+        samples = _time(lambda: compute_eoq_arrays(*params), repeat)
+        results.append(_result('core.compute_eoq_arrays', samples, n_skus=n))
+    return results
+
+
+def bench_figures(repeat):
+    import plotly.io as pio  # plotly is only needed for this part
+    import eoq_figures
+
+    results = []
+    for n_points in [100, 100_000]:
+        samples = _time(lambda: eoq_figures.cost_curve_figure.__wrapped__(1000, 50000.0, 2000.0, 223.6, n_points, 'plotly_white'), repeat)
+        results.append(_result('figures.cost_curve_figure', samples, n_points=n_points))
+    fig = eoq_figures.cost_curve_figure(1000, 50000.0, 2000.0, 223.6, 100, 'plotly_white')
+    # What st.plotly_chart does with a cached Figure on every rerun
+    samples = _time(lambda: pio.to_json(fig.to_dict(), validate=False), repeat)
+    results.append(_result('figures.serialize_cost_curve', samples, n_points=100))
+    samples = _time(lambda: eoq_figures.sensitivity_figure.__wrapped__(1000, 10000.0, 50000.0, 2000.0, 'D', 'D', 'Q', 'OT', 'Sens', 20, 'plotly_white'), repeat)
+    results.append(_result('figures.sensitivity_figure', samples))
+    return results
+
+
+class AppScriptError(RuntimeError):
+    """The dashboard script raised during a benchmarked AppTest run."""
+
+
+# Runs in a fresh interpreter: prints the streamlit import time and the first script run as JSON
+_COLD_RUN_SCRIPT = """
+import json, sys
+from time import perf_counter
+start = perf_counter()
+from streamlit.testing.v1 import AppTest
+imported = perf_counter()
+at = AppTest.from_file(sys.argv[1], default_timeout=float(sys.argv[2])).run()
+print(json.dumps({'import_s': imported - start, 'run_s': perf_counter() - imported,
+                  'errors': [exc.value for exc in at.exception]}))
+"""
+
+
+def _cold_start(timeout):
+    """
+    Launches a new Python process that imports streamlit and runs the script once.
+    Returns (process_seconds, first_run_seconds).
+    """
+    start = perf_counter()
+    proc = subprocess.run([sys.executable, '-c', _COLD_RUN_SCRIPT, APP_SCRIPT, str(timeout)],
+                          capture_output=True, text=True, check=False)
+    elapsed = perf_counter() - start
+    if proc.returncode != 0:
+        raise AppScriptError(proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else f"exit code {proc.returncode}")
+    run = json.loads(proc.stdout.strip().splitlines()[-1])
+    if run['errors']:
+        raise AppScriptError('; '.join(run['errors']))
+    return elapsed, run['run_s']
+
+
+def bench_app(repeat, timeout=60):
+    from streamlit.testing.v1 import AppTest  # optional: needs streamlit installed
+
+    def checked(run):
+        """Wraps an AppTest interaction so a crashing script fails the group instead of timing as a fast rerun."""
+        def wrapper():
+            at = run()
+            if at.exception:
+                raise AppScriptError('; '.join(exc.value for exc in at.exception))
+        return wrapper
+
+    results = []
+    # Run inside a temporary directory so the scenario store's SQLite file is not left behind
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        try:
+            # A cold start only counts in a process that has not imported numpy, pandas or eoq_core yet
+            cold = [_cold_start(timeout) for _ in range(repeat)]
+            results.append(_result('app.cold_start', [process for process, _ in cold]))
+            results.append(_result('app.cold_run', [run for _, run in cold]))
+
+            at = AppTest.from_file(APP_SCRIPT, default_timeout=timeout)
+            checked(lambda: at.run())()  # warm-up run so the rerun timings below start from a warm session
+            samples = _time(checked(lambda: at.run()), repeat)
+            results.append(_result('app.rerun', samples))
+
+            def switch_theme():
+                theme = at.sidebar.radio(key='theme')
+                return theme.set_value('Dark' if theme.value == 'Light' else 'Light').run()
+            results.append(_result('app.theme_switch', _time(checked(switch_theme), repeat)))
+
+            # Each main section is rendered on demand, so switching sections is a rerun too
+            sections = at.radio(key='active_tab').options
+            for i, section in enumerate(sections):
+                def switch_section(section=section):
+                    return at.radio(key='active_tab').set_value(section).run()
+                results.append(_result(f'app.section_{i + 1}', _time(checked(switch_section), repeat), section=section))
+        finally:
+            os.chdir(cwd)
+    return results
+
+
+def run_benchmarks(sizes=DEFAULT_SIZES, repeat=5, include_figures=True, include_app=True):
+    """Runs every available benchmark group and returns a JSON-ready report."""
+    report = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'numpy': np.__version__,
+        'benchmarks': bench_core(sizes, repeat),
+        'skipped': [],
+        'failed': [],
+    }
+    groups = []
+    if include_figures:
+        groups.append(('figures', lambda: bench_figures(repeat)))
+    if include_app:
+        groups.append(('app', lambda: bench_app(repeat)))
+    for name, bench in groups:
+        try:
+            report['benchmarks'].extend(bench())
+        except ImportError as exc:
+            report['skipped'].append({'group': name, 'reason': str(exc)})
+        except AppScriptError as exc:
+            report['failed'].append({'group': name, 'reason': str(exc)})
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark inti perhitungan, pembuatan grafik, dan rerun dashboard EOQ.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help="Jumlah SKU untuk benchmark inti")
+    parser.add_argument('--repeat', type=int, default=5, help="Pengulangan per benchmark (default: 5)")
+    parser.add_argument('--skip-figures', action='store_true', help="Lewati benchmark grafik Plotly")
+    parser.add_argument('--skip-app', action='store_true', help="Lewati benchmark rerun penuh via AppTest")
+    parser.add_argument('-o', '--output', help="Tulis hasil JSON ke file (default: stdout)")
+    args = parser.parse_args(argv)
+
+    report = run_benchmarks(args.sizes, args.repeat, not args.skip_figures, not args.skip_app)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
+    else:
+        print(text)
+    return 1 if report['failed'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,154 @@
+"""
+Headless command-line entry point for the EOQ calculations.
+
+Reads SKU parameters (columns D, C, A, h, L) from a CSV, JSON-lines or
+Parquet file, or from stdin, and streams the EOQ, reorder point and cost
+breakdown to CSV, JSON-lines or Parquet, chunk by chunk. Only eoq_core is
+imported, so no Streamlit server or plotly is needed.
+
+Examples:
+    python eoq_cli.py parameters.csv -o results.parquet
+    cat parameters.jsonl | python eoq_cli.py - --input-format jsonl --workers 4 > results.csv
+"""
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import argparse
+import os
+import sys
+
+from eoq_core import DEFAULT_CHUNKSIZE, compute_eoq_frame, iter_parameter_chunks
+
+FORMATS = ['csv', 'jsonl', 'parquet']
+FORMAT_BY_EXTENSION = {'.csv': 'csv', '.jsonl': 'jsonl', '.ndjson': 'jsonl', '.json': 'jsonl', '.parquet': 'parquet'}
+
+
+def _infer_format(path, explicit, default='csv'):
+    """Uses the explicit format if given, otherwise the file extension."""
+    if explicit:
+        return explicit
+    if path and path != '-':
+        return FORMAT_BY_EXTENSION.get(os.path.splitext(path)[1].lower(), default)
+    return default
+
+
+def _iter_results(chunks, workers):
+    """
+    Computes result chunks in order. With several workers, at most
+    2 * workers chunks are in flight, so memory stays bounded.
+    """
+    if workers <= 1:
+        for chunk in chunks:
+            yield compute_eoq_frame(chunk)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(compute_eoq_frame, chunk))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+class ResultWriter:
+    """
+    Appends result chunks to a CSV, JSON-lines or Parquet output. File
+    output is written to `path` + '.part' and renamed to `path` only when the
+    writer is closed without `discard`, so a failed run never leaves a
+    truncated result behind.
+    """
+
+    def __init__(self, path, file_format):
+        if file_format == 'parquet' and (path is None or path == '-'):
+            raise ValueError("Output Parquet membutuhkan path file (-o), tidak bisa ke stdout")
+        self.path = path
+        self.file_format = file_format
+        self._parquet_writer = None
+        self._header_written = False
+        self._tmp_path = None
+        self._handle = None
+        if path is None or path == '-':
+            self._handle = sys.stdout
+            return
+        self._tmp_path = path + '.part'
+        if file_format != 'parquet':  # pyarrow opens the Parquet path itself on the first chunk
+            self._handle = open(self._tmp_path, 'w', newline='', encoding='utf-8')
+
+    def write(self, df):
+        if self.file_format == 'csv':
+            df.to_csv(self._handle, header=not self._header_written, index=False)
+            self._header_written = True
+        elif self.file_format == 'jsonl':
+            text = df.to_json(orient='records', lines=True)
+            self._handle.write(text if text.endswith('\n') else text + '\n')
+        else:
+            import pyarrow as pa  # optional dependency, only needed for Parquet output
+            import pyarrow.parquet as pq
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            if self._parquet_writer is None:
+                self._parquet_writer = pq.ParquetWriter(self._tmp_path, table.schema)
+            self._parquet_writer.write_table(table)
+
+    def close(self, discard=False):
+        """Finishes the output; with `discard` the partial file is removed instead."""
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+        if self._handle is not None and self._handle is not sys.stdout:
+            self._handle.close()
+        if self._tmp_path is None:
+            return
+        if self.file_format == 'parquet' and self._parquet_writer is None:
+            return  # no chunks: like before, no Parquet file is created
+        if discard:
+            os.remove(self._tmp_path)
+        else:
+            os.replace(self._tmp_path, self.path)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Hitung EOQ, reorder point, dan rincian ongkos untuk banyak SKU tanpa Streamlit.")
+    parser.add_argument('input', nargs='?', default='-', help="File parameter (CSV/JSONL/Parquet), '-' untuk stdin (default)")
+    parser.add_argument('-o', '--output', default='-', help="File hasil, '-' untuk stdout (default)")
+    parser.add_argument('--input-format', choices=FORMATS, help="Format input (default: dari ekstensi file, atau csv)")
+    parser.add_argument('--output-format', choices=FORMATS, help="Format output (default: dari ekstensi file, atau csv)")
+    parser.add_argument('--id-column', help="Kolom identitas SKU yang ikut disalin ke hasil")
+    parser.add_argument('--chunksize', type=int, default=DEFAULT_CHUNKSIZE, help=f"Baris per blok (default: {DEFAULT_CHUNKSIZE})")
+    parser.add_argument('--workers', type=int, default=1, help="Jumlah proses paralel per blok (default: 1, 0 = semua CPU)")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    input_format = _infer_format(args.input, args.input_format)
+    output_format = _infer_format(args.output, args.output_format)
+    workers = args.workers if args.workers > 0 else (os.cpu_count() or 1)
+
+    if args.input == '-':
+        if input_format == 'parquet':
+            print("Input Parquet membutuhkan path file, tidak bisa dari stdin", file=sys.stderr)
+            return 1
+        source = sys.stdin.buffer
+    else:
+        source = args.input
+
+    try:
+        writer = ResultWriter(args.output, output_format)
+    except (ValueError, OSError) as exc:
+        print(exc, file=sys.stderr)
+        return 1
+    completed = False
+    try:
+        chunks = iter_parameter_chunks(source, input_format, args.chunksize, args.id_column)
+        for result in _iter_results(chunks, workers):
+            writer.write(result)
+        completed = True
+    except (ValueError, OSError, ImportError) as exc:
+        print(f"Gagal memproses input: {exc}", file=sys.stderr)
+        return 1
+    finally:
+        writer.close(discard=not completed)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
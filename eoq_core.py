@@ -0,0 +1,179 @@
+"""
+EOQ calculation core.
+
+Pure NumPy/pandas implementation of the continuous-review (Q, R) model used by
+the dashboard, so that a whole catalog of SKUs can be evaluated in one pass
+instead of one item at a time. The module is UI-free: it never imports
+streamlit or plotly, so batch jobs can use it directly. Single-item results
+are memoized on (D, C, A, h, L) so dashboard reruns reuse the numeric work.
+"""
+from collections import namedtuple
+from functools import lru_cache
+import math
+
+import numpy as np
+import pandas as pd
+
+# Column names expected in uploaded parameter files (same symbols as the sidebar)
+INPUT_COLUMNS = ['D', 'C', 'A', 'h', 'L']
+OUTPUT_COLUMNS = ['R', 'Q_optimal', 'T_optimal', 'condition_met', 'OB',
+                  'OP_optimal', 'OS_optimal', 'OT_optimal', 'frequency']
+
+# Rows per chunk when streaming a parameter file through the engine
+DEFAULT_CHUNKSIZE = 50_000
+
+# Scalar results for a single item, in the same order as OUTPUT_COLUMNS
+EOQResult = namedtuple('EOQResult', OUTPUT_COLUMNS)
+
+# Parameters that can be varied in the sensitivity analysis
+SENSITIVITY_PARAMS = ['D', 'A', 'h']
+
+
+def compute_eoq_arrays(D, C, A, h, L):
+    """
+    Computes every EOQ metric for arrays of parameters in one vectorized pass.
+    Rows with D <= 0 or h <= 0 get zeros, mirroring the single-item dashboard.
+    Returns a dict of NumPy arrays keyed by OUTPUT_COLUMNS.
+    """
+    D, C, A, h, L = np.broadcast_arrays(*(np.asarray(x, dtype=np.float64) for x in (D, C, A, h, L)))
+    valid = (D > 0) & (h > 0)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        Q_optimal = np.where(valid, np.sqrt((2 * D * A) / h), 0.0)
+        has_q = Q_optimal > 0
+        R = np.where(valid, D * L, 0.0)
+        T_optimal = np.where(valid, Q_optimal / D, 0.0)
+        OB = np.where(valid, D * C, 0.0)
+        OP_optimal = np.where(valid & has_q, (D / Q_optimal) * A, 0.0)
+        OS_optimal = np.where(valid, (Q_optimal / 2) * h, 0.0)
+        frequency = np.where(valid & has_q, D / Q_optimal, 0.0)
+
+    return {
+        'R': R,
+        'Q_optimal': Q_optimal,
+        'T_optimal': T_optimal,
+        'condition_met': valid & (L < T_optimal),
+        'OB': OB,
+        'OP_optimal': OP_optimal,
+        'OS_optimal': OS_optimal,
+        'OT_optimal': OB + OP_optimal + OS_optimal,
+        'frequency': frequency,
+    }
+
+
+def compute_eoq_frame(df):
+    """
+    Appends the EOQ metrics to a DataFrame holding the INPUT_COLUMNS.
+    Extra columns (e.g. a SKU identifier) are passed through untouched.
+    """
+    missing = [col for col in INPUT_COLUMNS if col not in df.columns]
+    if missing:
+        raise ValueError(f"Kolom wajib tidak ditemukan: {', '.join(missing)}")
+    results = compute_eoq_arrays(*(df[col].to_numpy(dtype=np.float64) for col in INPUT_COLUMNS))
+    out = df.copy()
+    # Inputs are always float64, so every chunk has the same schema (an all-integer
+    # chunk followed by one with decimals or blanks must not change the dtype)
+    out[INPUT_COLUMNS] = out[INPUT_COLUMNS].astype(np.float64)
+    for col in OUTPUT_COLUMNS:
+        out[col] = results[col]
+    return out
+
+
+def iter_parameter_chunks(source, file_format='csv', chunksize=DEFAULT_CHUNKSIZE, id_column=None):
+    """
+    Streams a CSV, JSON-lines or Parquet parameter file as DataFrame chunks
+    of at most `chunksize` rows, keeping only the input columns (plus
+    `id_column`, always read as strings so ids like 1001 and A-17 in
+    different chunks give the same schema). `source` may be a path or any
+    binary file-like object.
+    """
+    for chunk in _iter_raw_parameter_chunks(source, file_format, chunksize, id_column):
+        if id_column:
+            chunk[id_column] = chunk[id_column].astype('string')
+        yield chunk
+
+
+def _iter_raw_parameter_chunks(source, file_format, chunksize, id_column):
+    columns = INPUT_COLUMNS + ([id_column] if id_column else [])
+    if file_format == 'csv':
+        # Reading ids as text also keeps leading zeros
+        yield from pd.read_csv(source, usecols=columns, chunksize=chunksize, dtype={id_column: str} if id_column else None)
+    elif file_format == 'jsonl':
+        with pd.read_json(source, lines=True, chunksize=chunksize, dtype={id_column: str} if id_column else True) as reader:
+            for chunk in reader:
+                missing = [col for col in columns if col not in chunk.columns]
+                if missing:
+                    raise ValueError(f"Kolom wajib tidak ditemukan: {', '.join(missing)}")
+                yield chunk[columns].copy()
+    elif file_format == 'parquet':
+        import pyarrow.parquet as pq  # optional dependency, only needed for Parquet input
+        parquet_file = pq.ParquetFile(source)
+        for batch in parquet_file.iter_batches(batch_size=chunksize, columns=columns):
+            yield batch.to_pandas()
+    else:
+        raise ValueError(f"Format file tidak didukung: {file_format}")
+
+
+def iter_eoq_chunks(source, file_format='csv', chunksize=DEFAULT_CHUNKSIZE, id_column=None):
+    """
+    Runs the vectorized engine chunk by chunk, yielding result DataFrames.
+    Peak memory is bounded by the chunk size, not by the file size.
+    """
+    for chunk in iter_parameter_chunks(source, file_format, chunksize, id_column):
+        yield compute_eoq_frame(chunk)
+
+
+def _readonly(*arrays):
+    """Marks cached arrays read-only so callers cannot mutate the cache."""
+    for arr in arrays:
+        arr.flags.writeable = False
+    return arrays
+
+
+@lru_cache(maxsize=256)
+def calculate_eoq(D, C, A, h, L):
+    """
+    Computes the EOQ metrics for a single item (the tab1 calculation block).
+    Returns an EOQResult; invalid inputs (D <= 0 or h <= 0) give all zeros.
+    """
+    if D > 0 and h > 0:  # Avoid division by zero
+        R = D * L
+        Q_optimal = math.sqrt((2 * D * A) / h)
+        T_optimal = Q_optimal / D
+        condition_met = L < T_optimal
+        OB = D * C
+        OP_optimal = (D / Q_optimal) * A if Q_optimal > 0 else 0
+        OS_optimal = (Q_optimal / 2) * h
+        OT_optimal = OB + OP_optimal + OS_optimal
+        frequency = D / Q_optimal if Q_optimal > 0 else 0
+        return EOQResult(R, Q_optimal, T_optimal, condition_met, OB, OP_optimal, OS_optimal, OT_optimal, frequency)
+    return EOQResult(0, 0, 0, False, 0, 0, 0, 0, 0)
+
+
+@lru_cache(maxsize=64)
+def cost_curve(D, A, h, n_points=100):
+    """
+    Ordering, holding and total variable cost over a range of order sizes
+    around Q* (0.2 Q* to 3 Q*), as used by the cost curve chart.
+    Returns (Q_range, OP_range, OS_range, total_variable_cost_range).
+    """
+    Q_optimal = calculate_eoq(D, 0, A, h, 0).Q_optimal
+    Q_range = np.linspace(max(1, Q_optimal * 0.2), Q_optimal * 3, n_points)
+    OP_range = (D / Q_range) * A
+    OS_range = (Q_range / 2) * h
+    return _readonly(Q_range, OP_range, OS_range, OP_range + OS_range)
+
+
+@lru_cache(maxsize=64)
+def sensitivity_curve(D, C, A, h, param, n_points=20):
+    """
+    Varies one parameter (see SENSITIVITY_PARAMS) from 50% to 200% of its
+    current value and returns (x_range, Q_sens, OT_sens).
+    """
+    if param not in SENSITIVITY_PARAMS:
+        raise ValueError(f"Parameter sensitivitas tidak dikenal: {param}")
+    base = {'D': D, 'A': A, 'h': h}
+    x_range = np.linspace(base[param] * 0.5, base[param] * 2, n_points)
+    base[param] = x_range
+    results = compute_eoq_arrays(base['D'], C, base['A'], base['h'], 0)
+    return _readonly(x_range, results['Q_optimal'], results['OT_optimal'])
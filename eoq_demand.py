@@ -0,0 +1,151 @@
+"""
+Demand estimation from daily sales history.
+
+Reads per-SKU daily sales in chunks (or memory-mapped Parquet), derives the
+annualized demand D and its variability over a trailing window with grouped
+NumPy/pandas aggregations, and recomputes Q*, R and T only for SKUs whose
+window changed since the previous run. Like eoq_core, this module is UI-free.
+"""
+import numpy as np
+import pandas as pd
+
+from eoq_core import DEFAULT_CHUNKSIZE, INPUT_COLUMNS, OUTPUT_COLUMNS, compute_eoq_arrays
+
+DAYS_PER_YEAR = 365
+DEFAULT_WINDOW_DAYS = 365
+
+
+def iter_sales_chunks(source, file_format='csv', sku_column='sku', date_column='date', qty_column='qty',
+                      chunksize=DEFAULT_CHUNKSIZE):
+    """
+    Streams sales history as chunks with columns sku, date, qty.
+    Parquet paths are memory-mapped instead of read into memory up front.
+    """
+    columns = [sku_column, date_column, qty_column]
+    rename = {sku_column: 'sku', date_column: 'date', qty_column: 'qty'}
+    if file_format == 'csv':
+        chunks = pd.read_csv(source, usecols=columns, chunksize=chunksize)
+    elif file_format == 'parquet':
+        import pyarrow.parquet as pq  # optional dependency, only needed for Parquet input
+        parquet_file = pq.ParquetFile(source, memory_map=isinstance(source, str))
+        chunks = (batch.to_pandas() for batch in parquet_file.iter_batches(batch_size=chunksize, columns=columns))
+    else:
+        raise ValueError(f"Format file tidak didukung: {file_format}")
+    for chunk in chunks:
+        chunk = chunk.rename(columns=rename)
+        chunk['date'] = pd.to_datetime(chunk['date']).dt.normalize()
+        yield chunk
+
+
+def load_daily_sales(source, file_format='csv', sku_column='sku', date_column='date', qty_column='qty',
+                     chunksize=DEFAULT_CHUNKSIZE):
+    """
+    Reduces the raw history to one row per (sku, date) with the total
+    quantity, aggregating chunk by chunk so raw transactions never need to
+    be held in memory at once.
+    """
+    partials = [chunk.groupby(['sku', 'date'], sort=False, observed=True)['qty'].sum()
+                for chunk in iter_sales_chunks(source, file_format, sku_column, date_column, qty_column, chunksize)]
+    if not partials:
+        return pd.DataFrame(columns=['sku', 'date', 'qty'])
+    # A (sku, date) pair may straddle two chunks, so combine the partial sums once more
+    daily = pd.concat(partials).groupby(level=['sku', 'date'], sort=True).sum()
+    return daily.reset_index()
+
+
+def window_demand_stats(daily, window_days=DEFAULT_WINDOW_DAYS, as_of=None):
+    """
+    Annualized demand and variability per SKU over the `window_days` days
+    ending at `as_of` (default: the latest date in the history). Days without
+    sales count as zero demand; when the history starts inside the window,
+    only the days it covers are averaged, like the trailing view of
+    rolling_annual_demand. Returns a DataFrame indexed by sku with D,
+    daily and annual standard deviation, and the window sums used to detect
+    changes between runs.
+    """
+    as_of = pd.Timestamp(as_of) if as_of is not None else daily['date'].max()
+    start = as_of - pd.Timedelta(days=window_days - 1)
+    window = daily[(daily['date'] >= start) & (daily['date'] <= as_of)]
+
+    qty = window['qty'].to_numpy(dtype=np.float64)
+    codes, skus = pd.factorize(window['sku'])
+    # One bincount pass per statistic instead of a Python loop over SKUs
+    total = np.bincount(codes, weights=qty, minlength=len(skus))
+    total_sq = np.bincount(codes, weights=qty * qty, minlength=len(skus))
+    active_days = np.bincount(codes, minlength=len(skus))
+
+    # Days of the window actually covered by the history
+    covered_days = (as_of - max(start, daily['date'].min())).days + 1
+    mean_daily = total / covered_days
+    var_daily = np.maximum(total_sq / covered_days - mean_daily ** 2, 0.0) * covered_days / max(covered_days - 1, 1)
+    std_daily = np.sqrt(var_daily)
+
+    stats = pd.DataFrame({
+        'D': mean_daily * DAYS_PER_YEAR,
+        'demand_std_daily': std_daily,
+        'demand_std_annual': std_daily * np.sqrt(DAYS_PER_YEAR),
+        'active_days': active_days,
+        'window_sum': total,
+        'window_sum_sq': total_sq,
+    }, index=pd.Index(skus, name='sku'))
+    # SKUs with history but no sales inside the window still appear with D = 0
+    missing = pd.Index(daily['sku'].unique()).difference(stats.index)
+    if len(missing):
+        stats = pd.concat([stats, pd.DataFrame(0.0, index=pd.Index(missing, name='sku'), columns=stats.columns)])
+    stats.attrs['as_of'] = as_of
+    stats.attrs['window_days'] = window_days
+    return stats
+
+
+def rolling_annual_demand(daily, sku, window_days=DEFAULT_WINDOW_DAYS):
+    """
+    Trailing annualized demand and standard deviation for one SKU over
+    time, on a gap-free daily calendar spanning the whole history (missing
+    days filled with zero), so the last value matches window_demand_stats.
+    """
+    calendar = pd.date_range(daily['date'].min(), daily['date'].max(), freq='D', name='date')
+    series = daily.loc[daily['sku'] == sku].set_index('date')['qty'].reindex(calendar, fill_value=0)
+    rolling = series.rolling(window_days, min_periods=1)
+    return pd.DataFrame({
+        'D': rolling.mean() * DAYS_PER_YEAR,
+        'demand_std_annual': rolling.std().fillna(0.0) * np.sqrt(DAYS_PER_YEAR),
+    })
+
+
+def update_eoq(stats, params, previous=None):
+    """
+    Recomputes the EOQ metrics only for SKUs whose demand window or cost
+    parameters changed since `previous` (the DataFrame returned by the last
+    call). `params` holds C, A, h, L per SKU (indexed by sku) or a dict of
+    scalars applied to every SKU.
+    Returns (results, changed) where `changed` is the Index of recomputed SKUs.
+    """
+    if isinstance(params, dict):
+        params = pd.DataFrame({col: params[col] for col in ['C', 'A', 'h', 'L']}, index=stats.index)
+    current = stats.join(params[['C', 'A', 'h', 'L']], how='inner')
+    # D is part of the signature because the same window sums annualize differently for another window length
+    signature = ['window_sum', 'window_sum_sq', *INPUT_COLUMNS]
+
+    if previous is None or previous.empty:
+        changed_mask = np.ones(len(current), dtype=bool)
+    else:
+        before = previous.reindex(current.index)[signature]
+        # New SKUs (NaN in `before`) and any differing value count as changed
+        changed_mask = ~np.isclose(current[signature].to_numpy(dtype=np.float64),
+                                   before.to_numpy(dtype=np.float64), rtol=1e-12, atol=0).all(axis=1)
+
+    changed = current.index[changed_mask]
+    if previous is None or previous.empty:
+        results = current.copy()
+        for col in OUTPUT_COLUMNS:
+            results[col] = False if col == 'condition_met' else np.nan
+    else:
+        results = current.join(previous.reindex(current.index)[OUTPUT_COLUMNS])
+
+    if len(changed):
+        subset = current.loc[changed, INPUT_COLUMNS]
+        computed = compute_eoq_arrays(*(subset[col].to_numpy(dtype=np.float64) for col in INPUT_COLUMNS))
+        for col in OUTPUT_COLUMNS:
+            results.loc[changed, col] = computed[col]
+    results['condition_met'] = results['condition_met'].astype(bool)
+    return results, changed
@@ -0,0 +1,123 @@
+"""
+Plotly figure builders for the dashboard.
+
+Figures are built once per set of input parameters and template and cached
+as `go.Figure` objects. st.plotly_chart re-validates plain dicts on every
+call, but a Figure is only converted, so a cached Figure costs just its
+JSON serialization per rerun. A new theme builds each figure once more from
+the curve data that eoq_core already memoizes.
+Large series switch to WebGL (`Scattergl`) and are downsampled server-side
+with LTTB (Largest-Triangle-Three-Buckets) before they reach the browser.
+"""
+from functools import lru_cache
+
+import numpy as np
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+from eoq_core import cost_curve, sensitivity_curve
+
+# Above this many points a line trace is rendered with WebGL
+WEBGL_THRESHOLD = 5_000
+# Above this many points a line trace is downsampled with LTTB
+MAX_LINE_POINTS = 2_000
+
+
+def lttb(x, y, n_out):
+    """
+    Downsamples a line (x numeric or datetime, sorted ascending) to `n_out`
+    points with the Largest-Triangle-Three-Buckets algorithm, keeping the
+    visual shape.
+    Returns (x, y) unchanged when there is nothing to drop.
+    """
+    x = np.asarray(x)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return x, y
+    # Dates are bucketed on their integer timestamps; the original values are returned
+    if np.issubdtype(x.dtype, np.datetime64):
+        x_num = x.astype('datetime64[ns]').astype(np.int64).astype(np.float64)
+    else:
+        x_num = x.astype(np.float64)
+
+    # Bucket edges for the n_out - 2 middle buckets; first and last points are kept
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    prev = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        # The average of the next bucket is the third corner of the triangle
+        next_start, next_end = edges[i + 1], edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x_num[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+        area = np.abs((x_num[prev] - avg_x) * (y[start:end] - y[prev])
+                      - (x_num[prev] - x_num[start:end]) * (avg_y - y[prev]))
+        prev = start + int(np.argmax(area))
+        selected[i + 1] = prev
+    return x[selected], y[selected]
+
+
+def line_trace(x, y, **kwargs):
+    """
+    Builds a line trace sized for the browser: Scattergl above
+    WEBGL_THRESHOLD points and LTTB-downsampled above MAX_LINE_POINTS.
+    """
+    n = len(x)
+    if n > MAX_LINE_POINTS:
+        x, y = lttb(x, y, MAX_LINE_POINTS)
+    trace_type = go.Scattergl if n > WEBGL_THRESHOLD else go.Scatter
+    return trace_type(x=x, y=y, **kwargs)
+
+
+@lru_cache(maxsize=64)
+def cost_curve_figure(D, A, h, Q_optimal, n_points=100, template=None):
+    """Ordering/holding/total variable cost curves around Q* (tab2)."""
+    Q_range, OP_range, OS_range, total_range = cost_curve(D, A, h, n_points)
+    fig = go.Figure()
+    fig.add_trace(line_trace(Q_range, OP_range, mode='lines', name='Ongkos Pemesanan (OP)'))
+    fig.add_trace(line_trace(Q_range, OS_range, mode='lines', name='Ongkos Penyimpanan (OS)'))
+    fig.add_trace(line_trace(Q_range, total_range, mode='lines', name='Total Ongkos Variabel (OP+OS)', line=dict(width=4)))
+    fig.add_vline(x=Q_optimal, line_width=2, line_dash="dash", line_color="red", annotation_text=f"Q* Optimal: {Q_optimal:.0f}")
+    fig.update_layout(title='Kurva Biaya Variabel vs Ukuran Pesanan', xaxis_title='Ukuran Pesanan (Q)', yaxis_title='Biaya (Rp)',
+                      hovermode='x unified', template=template)
+    return fig
+
+
+@lru_cache(maxsize=64)
+def cost_pie_figure(OB, OP, OS, template=None):
+    """Composition of the total cost (tab2)."""
+    fig = go.Figure(go.Pie(values=[OB, OP, OS], labels=['Ongkos Pembelian', 'Ongkos Pemesanan', 'Ongkos Penyimpanan']))
+    fig.update_layout(title='Komposisi Biaya Total', template=template)
+    return fig
+
+
+@lru_cache(maxsize=64)
+def sensitivity_figure(D, C, A, h, param, x_label, title_q, title_ot, title, n_points=20, template=None):
+    """Q* and OT against one varied parameter, side by side (tab3)."""
+    x_range, Q_sens, OT_sens = sensitivity_curve(D, C, A, h, param, n_points)
+    mode = 'lines+markers' if n_points <= 100 else 'lines'
+    fig = make_subplots(rows=1, cols=2, subplot_titles=(title_q, title_ot))
+    fig.add_trace(line_trace(x_range, Q_sens, mode=mode, name='Q*'), row=1, col=1)
+    fig.add_trace(line_trace(x_range, OT_sens, mode=mode, name='Total Cost'), row=1, col=2)
+    fig.update_xaxes(title_text=x_label, row=1, col=1)
+    fig.update_xaxes(title_text=x_label, row=1, col=2)
+    fig.update_yaxes(title_text="Q* Optimal (unit)", row=1, col=1)
+    fig.update_yaxes(title_text="Total Ongkos (Rp)", row=1, col=2)
+    fig.update_layout(height=400, title_text=title, showlegend=False, template=template)
+    return fig
+
+
+def pareto_figure(values, title, yaxis_title, template=None):
+    """
+    Cumulative share of a cost across SKUs sorted from largest to smallest,
+    for catalogs of any size (downsampled above MAX_LINE_POINTS).
+    """
+    values = np.sort(np.asarray(values, dtype=np.float64))[::-1]
+    total = values.sum()
+    cumulative = np.cumsum(values) / total * 100 if total > 0 else np.zeros_like(values)
+    rank = np.arange(1, len(values) + 1) / max(len(values), 1) * 100
+    fig = go.Figure(line_trace(rank, cumulative, mode='lines', name=yaxis_title, fill='tozeroy'))
+    fig.update_layout(title=title, xaxis_title='Persentase SKU (%)', yaxis_title=yaxis_title, height=400, template=template)
+    return fig
@@ -0,0 +1,130 @@
+"""
+Multi-echelon inventory network (e.g. a DC feeding many stores).
+
+Locations and supply edges are held as flat NumPy arrays (an edge list
+indexed by integer node ids), not as Python graph objects, so networks with
+tens of thousands of nodes are solved with a handful of vectorized passes:
+echelon demand is propagated level by level from the stores up to the
+suppliers, and every node then gets its order quantity and reorder point
+from the eoq_core engine in one call. Like eoq_core, this module is UI-free.
+
+Nodes table columns: node, demand (external annual demand at the node),
+holding_cost, and optionally unit_cost, plus lead_time / ordering_cost for
+nodes supplied from outside the network.
+Edges table columns: parent, child, lead_time (years), ordering_cost, and
+optionally weight (share of the child's demand sourced from this parent).
+"""
+import numpy as np
+import pandas as pd
+
+from eoq_core import OUTPUT_COLUMNS, compute_eoq_arrays
+
+NODE_COLUMNS = ['node', 'demand', 'holding_cost']
+EDGE_COLUMNS = ['parent', 'child', 'lead_time', 'ordering_cost']
+
+
+def _check_columns(df, required, table):
+    missing = [col for col in required if col not in df.columns]
+    if missing:
+        raise ValueError(f"Kolom wajib tabel {table} tidak ditemukan: {', '.join(missing)}")
+
+
+def node_depths(n_nodes, parent, child):
+    """
+    Longest distance (in edges) from a supplier-less node to each node,
+    by vectorized relaxation over the edge list. Raises ValueError on cycles.
+    """
+    depth = np.zeros(n_nodes, dtype=np.int64)
+    for _ in range(n_nodes + 1):
+        updated = depth.copy()
+        np.maximum.at(updated, child, depth[parent] + 1)
+        if np.array_equal(updated, depth):
+            return depth
+        depth = updated
+    raise ValueError("Jaringan mengandung siklus pasokan")
+
+
+def echelon_demand(local_demand, parent, child, weight, depth):
+    """
+    Demand seen by each node: its own external demand plus the (weighted)
+    echelon demand of every node it supplies. Levels are processed from the
+    deepest up, so each child is final before it is added to its parents.
+    """
+    echelon = np.asarray(local_demand, dtype=np.float64).copy()
+    child_depth = depth[child]
+    for level in range(int(depth.max(initial=0)), 0, -1):
+        at_level = child_depth == level
+        np.add.at(echelon, parent[at_level], weight[at_level] * echelon[child[at_level]])
+    return echelon
+
+
+def solve_network(nodes, edges):
+    """
+    Computes echelon demand, order quantity, reorder point and cost
+    breakdown for every node. Lead time and ordering cost of a node come from
+    its inbound edges (weighted mean when it has several suppliers) or from
+    the nodes table for nodes supplied from outside the network.
+    Returns a DataFrame indexed by node.
+    """
+    _check_columns(nodes, NODE_COLUMNS, 'node')
+    _check_columns(edges, EDGE_COLUMNS, 'edge')
+    node_index = pd.Index(nodes['node'])
+    if not node_index.is_unique:
+        raise ValueError("Nama node harus unik")
+    n = len(node_index)
+
+    parent = node_index.get_indexer(edges['parent'])
+    child = node_index.get_indexer(edges['child'])
+    if (parent < 0).any() or (child < 0).any():
+        raise ValueError("Edge merujuk ke node yang tidak ada di tabel node")
+    weight = edges['weight'].to_numpy(dtype=np.float64) if 'weight' in edges else np.ones(len(edges))
+    edge_lead = edges['lead_time'].to_numpy(dtype=np.float64)
+    edge_cost = edges['ordering_cost'].to_numpy(dtype=np.float64)
+
+    depth = node_depths(n, parent, child)
+    demand = echelon_demand(nodes['demand'].to_numpy(dtype=np.float64), parent, child, weight, depth)
+
+    # Inbound lead time and ordering cost: weighted mean over supplying edges
+    inbound_weight = np.bincount(child, weights=weight, minlength=n)
+    has_supplier = inbound_weight > 0
+    external_lead = nodes['lead_time'].to_numpy(dtype=np.float64) if 'lead_time' in nodes else np.zeros(n)
+    external_cost = nodes['ordering_cost'].to_numpy(dtype=np.float64) if 'ordering_cost' in nodes else np.zeros(n)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        lead = np.where(has_supplier, np.bincount(child, weights=weight * edge_lead, minlength=n) / inbound_weight, external_lead)
+        ordering_cost = np.where(has_supplier, np.bincount(child, weights=weight * edge_cost, minlength=n) / inbound_weight, external_cost)
+
+    # Longest cumulative lead time from an external supplier, level by level downstream
+    cumulative_lead = np.where(has_supplier, 0.0, external_lead)
+    child_depth = depth[child]
+    for level in range(1, int(depth.max(initial=0)) + 1):
+        at_level = child_depth == level
+        np.maximum.at(cumulative_lead, child[at_level], cumulative_lead[parent[at_level]] + edge_lead[at_level])
+
+    unit_cost = nodes['unit_cost'].to_numpy(dtype=np.float64) if 'unit_cost' in nodes else np.zeros(n)
+    holding = nodes['holding_cost'].to_numpy(dtype=np.float64)
+    results = compute_eoq_arrays(demand, unit_cost, ordering_cost, holding, lead)
+
+    out = pd.DataFrame({
+        'depth': depth,
+        'n_suppliers': np.bincount(child, minlength=n),
+        'n_customers': np.bincount(parent, minlength=n),
+        'echelon_demand': demand,
+        'lead_time': lead,
+        'cumulative_lead_time': cumulative_lead,
+        'ordering_cost': ordering_cost,
+        'holding_cost': holding,
+        **{col: results[col] for col in OUTPUT_COLUMNS},
+        # Echelon reorder point: demand over the whole upstream replenishment path
+        'echelon_reorder_point': demand * cumulative_lead,
+    }, index=node_index)
+    return out
+
+
+def summarize_by_level(solution):
+    """Node counts, demand and total cost per network level (0 = top)."""
+    return solution.groupby('depth').agg(
+        nodes=('echelon_demand', 'size'),
+        echelon_demand=('echelon_demand', 'sum'),
+        order_quantity=('Q_optimal', 'sum'),
+        total_cost=('OT_optimal', 'sum'),
+    )
@@ -0,0 +1,172 @@
+"""
+Quantity-discount and multi-constraint EOQ optimizer.
+
+Extends the single-price model in eoq_core with supplier price breaks
+(all-units and incremental) evaluated for every SKU and tier at once, and
+with the multi-item EOQ under shared resource limits (warehouse space,
+inventory budget) solved by bisection on the Lagrange multipliers.
+Results use the same keys as eoq_core.OUTPUT_COLUMNS so they can feed the
+existing cost-breakdown and summary views. Like eoq_core, this module is UI-free.
+"""
+import numpy as np
+
+DISCOUNT_TYPES = ['all_units', 'incremental']
+
+
+def _as_tiers(breaks, prices, n_items):
+    """Broadcasts price-break tables to shape (n_items, n_tiers) and validates them."""
+    breaks = np.broadcast_to(np.asarray(breaks, dtype=np.float64), (n_items, np.shape(breaks)[-1]))
+    prices = np.broadcast_to(np.asarray(prices, dtype=np.float64), breaks.shape)
+    if np.any(breaks[:, 0] != 0):
+        raise ValueError("Batas kuantitas tier pertama harus 0")
+    if np.any(np.diff(breaks, axis=1) <= 0):
+        raise ValueError("Batas kuantitas tier harus naik")
+    return breaks, prices
+
+
+def parse_price_tiers(text):
+    """
+    Parses price tiers written one per line as "min_quantity : unit_price"
+    (e.g. "0 : 10000"). Returns (breaks, prices) sorted by quantity.
+    """
+    tiers = []
+    for line in text.strip().splitlines():
+        if not line.strip():
+            continue
+        try:
+            quantity, price = (float(part.replace(',', '')) for part in line.split(':'))
+        except ValueError:
+            raise ValueError(f"Format tier tidak valid: '{line.strip()}' (gunakan 'batas : harga')") from None
+        tiers.append((quantity, price))
+    if not tiers:
+        raise ValueError("Minimal satu tier harga dibutuhkan")
+    tiers.sort()
+    breaks, prices = zip(*tiers)
+    return list(breaks), list(prices)
+
+
+def optimize_quantity_discount(D, A, h, L, breaks, prices, discount_type='all_units', holding_rate=None):
+    """
+    Finds the cost-minimizing order quantity under price breaks.
+
+    `breaks[k]` is the smallest quantity priced at `prices[k]` (breaks[0] = 0);
+    both may be 1-D (shared by all SKUs) or 2-D (one row per SKU).
+    If `holding_rate` is given the holding cost is that fraction of the unit
+    price, otherwise the fixed `h` is used.
+    Returns a dict with the eoq_core.OUTPUT_COLUMNS keys plus 'tier',
+    'unit_price' (average price paid per unit) and 'tier_costs' (n, k).
+    """
+    if discount_type not in DISCOUNT_TYPES:
+        raise ValueError(f"Jenis diskon tidak dikenal: {discount_type}")
+    D, A, h, L = (np.atleast_1d(np.asarray(x, dtype=np.float64)) for x in (D, A, h, L))
+    D, A, h, L = np.broadcast_arrays(D, A, h, L)
+    breaks, prices = _as_tiers(breaks, prices, len(D))
+    upper = np.concatenate([breaks[:, 1:], np.full((len(D), 1), np.inf)], axis=1)
+    D2, A2, h2 = D[:, None], A[:, None], h[:, None]
+
+    if discount_type == 'all_units':
+        # Every unit is charged the tier price; no fixed purchase-cost offset
+        offset = np.zeros_like(prices)
+    else:
+        # Cost of the first breaks[k] units bought at the lower tiers' prices
+        block_cost = prices[:, :-1] * np.diff(breaks, axis=1)
+        fixed = np.concatenate([np.zeros((len(D), 1)), np.cumsum(block_cost, axis=1)], axis=1)
+        offset = fixed - prices * breaks
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        hold = h2 if holding_rate is None else holding_rate * prices
+        # Per-tier EOQ: the offset acts like an extra ordering cost per order
+        Q_tier = np.sqrt(2 * D2 * (A2 + offset) / hold)
+        if discount_type == 'all_units':
+            # Raise to the break if below it; an EOQ above the next break is dominated
+            Q = np.maximum(Q_tier, breaks)
+            feasible = Q_tier < upper
+        else:
+            Q = np.clip(Q_tier, np.maximum(breaks, 1e-9), np.nextafter(upper, 0))
+            feasible = np.isfinite(Q)
+        Q = np.where(feasible & (Q > 0), Q, np.nan)
+
+        purchase_per_order = offset + prices * Q
+        unit_price = purchase_per_order / Q
+        OB = D2 * unit_price
+        OP = (D2 / Q) * A2
+        OS = h2 * Q / 2 if holding_rate is None else holding_rate * purchase_per_order / 2
+        total = np.where(np.isnan(Q), np.inf, OB + OP + OS)
+
+    tier = np.argmin(total, axis=1)
+    rows = np.arange(len(D))
+    Q_best = Q[rows, tier]
+    OT = total[rows, tier]
+    T_optimal = Q_best / D
+    return {
+        'R': D * L,
+        'Q_optimal': Q_best,
+        'T_optimal': T_optimal,
+        'condition_met': L < T_optimal,
+        'OB': OB[rows, tier],
+        'OP_optimal': OP[rows, tier],
+        'OS_optimal': OS[rows, tier],
+        'OT_optimal': OT,
+        'frequency': D / Q_best,
+        'tier': tier,
+        'unit_price': unit_price[rows, tier],
+        'tier_costs': total,
+    }
+
+
+def constrained_eoq(D, A, h, usage, capacity, tol=1e-6, max_iter=100, max_doublings=200):
+    """
+    Multi-item EOQ under shared linear resource limits
+    sum_i usage[j, i] * Q_i <= capacity[j] (e.g. space per unit, price per unit).
+
+    The Lagrangian gives Q_i = sqrt(2 D_i A_i / (h_i + 2 sum_j lambda_j usage[j, i])).
+    Each multiplier is found by bisection, one constraint at a time, until
+    the multipliers stop changing. Every evaluation is vectorized over items.
+    Items with missing or non-finite values, D <= 0 or h <= 0 get Q = 0 and
+    do not count against the limits, as in compute_eoq_arrays.
+    Returns (Q, multipliers) with Q of shape (n_items,).
+    """
+    D, A, h = (np.asarray(x, dtype=np.float64) for x in (D, A, h))
+    usage = np.atleast_2d(np.asarray(usage, dtype=np.float64))
+    capacity = np.atleast_1d(np.asarray(capacity, dtype=np.float64))
+    if usage.shape != (len(capacity), len(D)):
+        raise ValueError("Ukuran matriks pemakaian sumber daya tidak sesuai")
+    if not np.all(np.isfinite(capacity) & (capacity > 0)):
+        raise ValueError("Kapasitas sumber daya harus lebih besar dari 0")
+
+    valid = (np.isfinite(D) & np.isfinite(A) & np.isfinite(h) & np.isfinite(usage).all(axis=0)
+             & (D > 0) & (A >= 0) & (h > 0))
+    D, A, h, usage = D[valid], A[valid], h[valid], usage[:, valid]
+
+    def order_quantities(lam):
+        return np.sqrt(2 * D * A / (h + 2 * lam @ usage))
+
+    lam = np.zeros(len(capacity))
+    for _ in range(max_iter):
+        previous = lam.copy()
+        for j in range(len(capacity)):
+            lam[j] = 0.0
+            if usage[j] @ order_quantities(lam) <= capacity[j]:
+                continue
+            # Grow the bracket until constraint j is met, then bisect
+            high = 1.0
+            for _ in range(max_doublings):
+                lam[j] = high
+                if usage[j] @ order_quantities(lam) <= capacity[j]:
+                    break
+                high *= 2
+            else:
+                raise ValueError("Batasan sumber daya tidak dapat dipenuhi (pengali Lagrange tidak konvergen)")
+            low = 0.0
+            while high - low > tol * max(high, 1.0):
+                lam[j] = (low + high) / 2
+                if usage[j] @ order_quantities(lam) > capacity[j]:
+                    low = lam[j]
+                else:
+                    high = lam[j]
+            lam[j] = high
+        if np.allclose(lam, previous, rtol=tol, atol=tol):
+            break
+    Q = np.zeros(len(valid))
+    Q[valid] = order_quantities(lam)
+    return Q, lam
@@ -0,0 +1,201 @@
+"""
+Inventory policy engines sharing one vectorized evaluation interface.
+
+Besides the continuous-review (Q, R) model of eoq_core, this module covers
+periodic review (R, S), min-max (s, S) and the production-rate EPQ variant.
+Each policy exposes `annual_cost(x, params)` for its single decision
+variable and `optimize(params)`, which runs a golden-section search for every
+SKU at once (each array element keeps its own bracket). `params` is a dict of
+arrays or scalars with D, C, A, h, L and optionally sigma (annual demand
+standard deviation), service_level, review_period (years) and
+production_rate (units/year). Like eoq_core, this module is UI-free.
+"""
+from statistics import NormalDist
+import math
+
+import numpy as np
+
+INV_PHI = (math.sqrt(5) - 1) / 2  # 1 / golden ratio
+
+DEFAULT_SERVICE_LEVEL = 0.95
+DEFAULT_REVIEW_PERIOD = 7 / 365  # one week, in years
+
+
+def golden_section_minimize(func, low, high, tol=1e-6, max_iter=200):
+    """
+    Minimizes a unimodal function element-wise on [low, high] with the
+    golden-section search. `func` takes and returns arrays, so every SKU
+    is searched simultaneously. Returns the array of minimizers.
+    """
+    low = np.array(low, dtype=np.float64)
+    high = np.array(high, dtype=np.float64)
+    low, high = np.broadcast_arrays(low, high)
+    low, high = low.copy(), high.copy()
+    x1 = high - INV_PHI * (high - low)
+    x2 = low + INV_PHI * (high - low)
+    f1, f2 = func(x1), func(x2)
+    for _ in range(max_iter):
+        if np.all(high - low <= tol * np.maximum(np.abs(high), 1.0)):
+            break
+        left = f1 < f2  # minimum lies in [low, x2]
+        high = np.where(left, x2, high)
+        low = np.where(left, low, x1)
+        new_x1 = high - INV_PHI * (high - low)
+        new_x2 = low + INV_PHI * (high - low)
+        # Reuse the surviving interior point; evaluate only one new point per element
+        x1, x2 = np.where(left, new_x1, x2), np.where(left, x1, new_x2)
+        x_new = np.where(left, x1, x2)
+        f_new = func(x_new)
+        f1, f2 = np.where(left, f_new, f2), np.where(left, f1, f_new)
+    return (low + high) / 2
+
+
+def _get(params, key, default):
+    return np.asarray(params.get(key, default), dtype=np.float64)
+
+
+def _safety_stock(params, horizon):
+    """z * sigma * sqrt(horizon) for a horizon in years (zero when sigma is 0)."""
+    z = NormalDist().inv_cdf(float(params.get('service_level', DEFAULT_SERVICE_LEVEL)))
+    return max(z, 0.0) * _get(params, 'sigma', 0.0) * np.sqrt(horizon)
+
+
+class Policy:
+    """Base class: one decision variable, a cost model and a search bracket."""
+    name = ''
+    label = ''
+
+    def bounds(self, params):
+        """Search bracket (low, high) for the decision variable, per SKU."""
+        D, A, h = _get(params, 'D', 0), _get(params, 'A', 0), _get(params, 'h', 1)
+        Q_eoq = np.sqrt(2 * D * A / h)
+        return np.full_like(Q_eoq, 1e-9), np.maximum(Q_eoq, 1.0) * 10
+
+    def valid(self, params):
+        """Rows the cost model is defined for (D > 0 and h > 0), as in eoq_core."""
+        D, h = _get(params, 'D', 0), _get(params, 'h', 1)
+        return np.isfinite(D) & np.isfinite(h) & (D > 0) & (h > 0)
+
+    def annual_cost(self, x, params):
+        """Cost components for decision `x`: dict with OB, OP, OS and OT arrays."""
+        raise NotImplementedError
+
+    def policy_parameters(self, x, params):
+        """Human-readable policy parameters for decision `x` (dict of arrays)."""
+        raise NotImplementedError
+
+    def optimize(self, params):
+        """
+        Optimal decision for every SKU plus its parameters and cost components.
+        Invalid rows (see `valid`) get zeros everywhere, like eoq_core.
+        """
+        valid = self.valid(params)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            low, high = self.bounds(params)
+            # A collapsed bracket lets invalid rows drop out of the search immediately
+            low, high = np.where(valid, low, 1.0), np.where(valid, high, 1.0)
+            x = golden_section_minimize(lambda v: self.annual_cost(v, params)['OT'], low, high)
+            result = {'x': x, **self.policy_parameters(x, params), **self.annual_cost(x, params)}
+        return {key: np.where(valid, value, 0.0) for key, value in result.items()}
+
+
+class ContinuousReview(Policy):
+    """(Q, R): order Q whenever the inventory position reaches R = D L + SS."""
+    name = 'continuous_qr'
+    label = 'Continuous Review (Q, R)'
+
+    def annual_cost(self, Q, params):
+        D, C, A, h, L = (_get(params, k, 0) for k in ['D', 'C', 'A', 'h', 'L'])
+        OB, OP = D * C, D / Q * A
+        OS = h * (Q / 2 + _safety_stock(params, L))
+        return {'OB': OB, 'OP': OP, 'OS': OS, 'OT': OB + OP + OS}
+
+    def policy_parameters(self, Q, params):
+        D, L = _get(params, 'D', 0), _get(params, 'L', 0)
+        return {'Q': Q, 'R': D * L + _safety_stock(params, L), 'T': Q / D}
+
+
+class PeriodicReview(Policy):
+    """(R, S): every review period T, order up to S = D (T + L) + SS."""
+    name = 'periodic_rs'
+    label = 'Periodic Review (R, S)'
+
+    def bounds(self, params):
+        low, high = super().bounds(params)
+        D = np.maximum(_get(params, 'D', 1), 1e-9)
+        return low / D, high / D
+
+    def annual_cost(self, T, params):
+        D, C, A, h, L = (_get(params, k, 0) for k in ['D', 'C', 'A', 'h', 'L'])
+        OB, OP = D * C, A / T
+        # Protection must cover the review period plus the lead time
+        OS = h * (D * T / 2 + _safety_stock(params, T + L))
+        return {'OB': OB, 'OP': OP, 'OS': OS, 'OT': OB + OP + OS}
+
+    def policy_parameters(self, T, params):
+        D, L = _get(params, 'D', 0), _get(params, 'L', 0)
+        return {'Q': D * T, 'T': T, 'S': D * (T + L) + _safety_stock(params, T + L)}
+
+
+class MinMax(Policy):
+    """
+    (s, S) reviewed every `review_period`: when stock is at or below s, order
+    up to S. The decision is the gap S - s; the expected order also covers
+    the undershoot below s, approximated by half a review period of demand.
+    """
+    name = 'min_max_ss'
+    label = 'Min-Max (s, S)'
+
+    def _undershoot(self, params):
+        return _get(params, 'D', 0) * _get(params, 'review_period', DEFAULT_REVIEW_PERIOD) / 2
+
+    def annual_cost(self, gap, params):
+        D, C, A, h, L = (_get(params, k, 0) for k in ['D', 'C', 'A', 'h', 'L'])
+        P = _get(params, 'review_period', DEFAULT_REVIEW_PERIOD)
+        Q = gap + self._undershoot(params)
+        OB, OP = D * C, D / Q * A
+        OS = h * (Q / 2 + _safety_stock(params, L + P))
+        return {'OB': OB, 'OP': OP, 'OS': OS, 'OT': OB + OP + OS}
+
+    def policy_parameters(self, gap, params):
+        D, L = _get(params, 'D', 0), _get(params, 'L', 0)
+        P = _get(params, 'review_period', DEFAULT_REVIEW_PERIOD)
+        s = D * (L + P / 2) + _safety_stock(params, L + P)
+        Q = gap + self._undershoot(params)
+        return {'Q': Q, 's': s, 'S': s + gap, 'T': Q / D}
+
+
+class ProductionEPQ(Policy):
+    """EPQ: lots are produced at rate p > D, so the peak stock is Q (1 - D/p)."""
+    name = 'epq'
+    label = 'Production (EPQ)'
+
+    def bounds(self, params):
+        # The optimum is EOQ / sqrt(1 - D/p), far above 10x EOQ when p is close to D
+        low, high = super().bounds(params)
+        D, p = _get(params, 'D', 0), _get(params, 'production_rate', np.inf)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            scale = np.where(p > D, 1 / np.sqrt(1 - D / p), 1.0)
+        return low, high * scale
+
+    def annual_cost(self, Q, params):
+        D, C, A, h = (_get(params, k, 0) for k in ['D', 'C', 'A', 'h'])
+        p = _get(params, 'production_rate', np.inf)
+        utilization = np.where(p > D, 1 - D / p, np.nan)  # infeasible when p <= D
+        OB, OP = D * C, D / Q * A
+        OS = h * (Q * utilization / 2 + _safety_stock(params, _get(params, 'L', 0)))
+        return {'OB': OB, 'OP': OP, 'OS': OS, 'OT': OB + OP + OS}
+
+    def policy_parameters(self, Q, params):
+        D, L = _get(params, 'D', 0), _get(params, 'L', 0)
+        p = _get(params, 'production_rate', np.inf)
+        return {'Q': Q, 'R': D * L + _safety_stock(params, L), 'T': Q / D,
+                'max_inventory': Q * np.where(p > D, 1 - D / p, np.nan)}
+
+
+POLICIES = [ContinuousReview(), PeriodicReview(), MinMax(), ProductionEPQ()]
+
+
+def compare_policies(params, policies=POLICIES):
+    """Optimizes every policy for the same SKU arrays. Returns {policy.name: result}."""
+    return {policy.name: policy.optimize(params) for policy in policies}
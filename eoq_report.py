@@ -0,0 +1,518 @@
+"""
+Catalog-wide report export (HTML, Excel or PDF) for the EOQ results.
+
+A report holds the catalog summary, portfolio-level recommendations, a
+Pareto chart of the total cost and the top SKUs, followed by one detail row
+per SKU with its own recommendation. Reports are built in two passes over
+result chunks: the first only accumulates totals and the small arrays the
+charts need, the second streams the detail rows to disk, so a 100k-SKU
+report never holds the whole document in memory. `submit_export` runs the
+export in a background thread pool and exposes its progress for the UI.
+
+Excel needs xlsxwriter (written in constant-memory mode) and PDF needs
+reportlab; both are imported only when that format is requested.
+
+Example:
+    python eoq_report.py parameters.csv -o laporan.xlsx --id-column sku
+"""
+from concurrent.futures import ThreadPoolExecutor, wait
+import argparse
+import html
+import json
+import os
+import sys
+import threading
+
+import numpy as np
+import pandas as pd
+
+from eoq_core import DEFAULT_CHUNKSIZE, iter_eoq_chunks
+
+REPORT_FORMATS = ['html', 'xlsx', 'pdf']
+MIME_TYPES = {
+    'html': 'text/html',
+    'xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+    'pdf': 'application/pdf',
+}
+DEFAULT_CHUNK_ROWS = 10_000
+# Number of SKUs in the "largest total cost" chart
+TOP_N = 20
+# Points on the Pareto curve (0%, 1%, ..., 100% of SKUs)
+PARETO_POINTS = 101
+# Rows per worksheet in .xlsx files (header row included)
+MAX_EXCEL_ROWS = 1_048_576
+
+COST_COLUMNS = ['OB', 'OP_optimal', 'OS_optimal', 'OT_optimal']
+CONDITION_LABELS = {True: 'L < T', False: 'L ≥ T'}
+
+
+class ExportProgress:
+    """Progress of one export, updated by the worker thread and read by the UI."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.stage = 'Menunggu antrean'
+        self.done = 0
+        self.total = 0
+
+    def update(self, stage=None, done=None, total=None):
+        with self._lock:
+            if stage is not None:
+                self.stage = stage
+            if done is not None:
+                self.done = done
+            if total is not None:
+                self.total = total
+
+    def snapshot(self):
+        """Returns (stage, done, total) read consistently."""
+        with self._lock:
+            return self.stage, self.done, self.total
+
+    @property
+    def fraction(self):
+        _, done, total = self.snapshot()
+        return min(done / total, 1.0) if total else 0.0
+
+
+def _chunk_factory(source, chunk_rows):
+    """
+    Normalizes the report source to a zero-argument callable returning a
+    fresh iterator of result chunks (the report reads its input twice).
+    """
+    if isinstance(source, pd.DataFrame):
+        return lambda: (source.iloc[start:start + chunk_rows] for start in range(0, len(source), chunk_rows))
+    if callable(source):
+        return source
+    raise TypeError("Sumber laporan harus DataFrame atau fungsi yang menghasilkan iterator blok hasil")
+
+
+def sku_recommendations(chunk):
+    """One recommendation sentence per SKU, following the Ringkasan tab."""
+    return [
+        f"Pesan {Q:,.0f} unit saat stok mencapai {R:,.0f} unit (setiap {365 / f if f > 0 else 0:,.0f} hari)"
+        if met else
+        f"L ≥ T: tambah safety stock di atas R = {R:,.0f} unit atau kurangi lead time"
+        for Q, R, f, met in zip(chunk['Q_optimal'], chunk['R'], chunk['frequency'], chunk['condition_met'].astype(bool))
+    ]
+
+
+def summarize_catalog(chunks, id_column=None):
+    """
+    First pass: totals, Pareto curve and top-N SKUs by total cost. Only the
+    OT column is kept across chunks (8 bytes per SKU) for the Pareto curve.
+    """
+    n_skus, n_not_met, sum_Q = 0, 0, 0.0
+    totals = dict.fromkeys(COST_COLUMNS, 0.0)
+    costs, top = [], None
+    for chunk in chunks:
+        ot = chunk['OT_optimal'].to_numpy(dtype=np.float64)
+        for col in COST_COLUMNS:
+            totals[col] += float(np.nansum(chunk[col].to_numpy(dtype=np.float64)))
+        sum_Q += float(np.nansum(chunk['Q_optimal'].to_numpy(dtype=np.float64)))
+        n_not_met += int((~chunk['condition_met'].astype(bool)).sum())
+        costs.append(ot)
+        labels = (chunk[id_column].astype(str).to_numpy() if id_column
+                  else np.char.add('SKU #', np.arange(n_skus + 1, n_skus + len(chunk) + 1).astype(str)))
+        candidates = pd.DataFrame({'label': labels, 'OT_optimal': ot}).nlargest(TOP_N, 'OT_optimal')
+        top = candidates if top is None else pd.concat([top, candidates]).nlargest(TOP_N, 'OT_optimal')
+        n_skus += len(chunk)
+
+    values = np.sort(np.concatenate(costs))[::-1] if costs else np.zeros(0)
+    share_x = np.linspace(0, 100, PARETO_POINTS)
+    if len(values) and values.sum() > 0:
+        cumulative = np.concatenate([[0.0], np.cumsum(values) / values.sum() * 100])
+        share_y = cumulative[np.ceil(share_x / 100 * len(values)).astype(np.int64)]
+    else:
+        share_y = np.zeros(PARETO_POINTS)
+    return {
+        'id_column': id_column,
+        'n_skus': n_skus,
+        'n_not_met': n_not_met,
+        'totals': totals,
+        'mean_Q': sum_Q / n_skus if n_skus else 0.0,
+        'pareto': (share_x, share_y),
+        'top': top if top is not None else pd.DataFrame(columns=['label', 'OT_optimal']),
+    }
+
+
+def catalog_recommendations(summary):
+    """Portfolio-level recommendations derived from the catalog summary."""
+    n = summary['n_skus']
+    if not n:
+        return ["Katalog kosong: tidak ada SKU yang dianalisis."]
+    share_x, share_y = summary['pareto']
+    top20 = float(np.interp(20, share_x, share_y))
+    recommendations = [
+        f"20% SKU teratas menyumbang {top20:.1f}% dari total ongkos; prioritaskan negosiasi harga dan peninjauan parameter pada kelompok ini.",
+    ]
+    if summary['n_not_met']:
+        recommendations.append(
+            f"{summary['n_not_met']:,} SKU ({summary['n_not_met'] / n:.1%}) memiliki L ≥ T: pertimbangkan safety stock, "
+            "evaluasi supplier untuk mengurangi lead time, dan pantau risiko stockout lebih ketat.")
+    else:
+        recommendations.append("Seluruh SKU memenuhi kondisi L < T; model EOQ dapat dipakai tanpa safety stock tambahan.")
+    totals = summary['totals']
+    recommendations.append(
+        f"Ongkos pemesanan (Rp {totals['OP_optimal']:,.0f}) dan penyimpanan (Rp {totals['OS_optimal']:,.0f}) seimbang pada Q*; "
+        "menyimpang dari Q* akan menaikkan total ongkos variabel.")
+    return recommendations
+
+
+def _summary_rows(summary):
+    totals = summary['totals']
+    return [
+        ('Jumlah SKU', f"{summary['n_skus']:,}"),
+        ('SKU dengan L ≥ T', f"{summary['n_not_met']:,}"),
+        ('Rata-rata Q*', f"{summary['mean_Q']:,.2f} unit"),
+        ('Total Ongkos Pembelian (OB)', f"Rp {totals['OB']:,.2f}"),
+        ('Total Ongkos Pemesanan (OP)', f"Rp {totals['OP_optimal']:,.2f}"),
+        ('Total Ongkos Penyimpanan (OS)', f"Rp {totals['OS_optimal']:,.2f}"),
+        ('Total Ongkos (OT)', f"Rp {totals['OT_optimal']:,.2f}"),
+    ]
+
+
+def _detail_frame(chunk):
+    """Detail rows as written to the report: readable condition plus the recommendation."""
+    out = chunk.copy()
+    out['condition_met'] = out['condition_met'].astype(bool).map(CONDITION_LABELS)
+    out['Rekomendasi'] = sku_recommendations(chunk)
+    return out
+
+
+def _script_json(value):
+    """JSON safe to inline in a <script> block: SKU labels cannot close the tag or open a comment."""
+    return json.dumps(value).replace('<', '\\u003c').replace('>', '\\u003e').replace('&', '\\u0026')
+
+
+class HTMLReportWriter:
+    """
+    Single-file HTML page. Charts are plotly.js specs rendered by the library
+    loaded from the CDN, so they need network access when the page is opened.
+    """
+
+    def __init__(self, path, summary, recommendations):
+        self._handle = open(path, 'w', encoding='utf-8')
+        self._columns = None
+        share_x, share_y = summary['pareto']
+        top = summary['top']
+        charts = {
+            'pareto': {'data': [{'x': share_x.tolist(), 'y': share_y.tolist(), 'type': 'scatter', 'mode': 'lines', 'fill': 'tozeroy'}],
+                       'layout': {'title': 'Kurva Pareto Total Ongkos per SKU', 'xaxis': {'title': 'Persentase SKU (%)'},
+                                  'yaxis': {'title': 'Kumulatif Total Ongkos (%)'}}},
+            'top': {'data': [{'x': top['OT_optimal'].tolist()[::-1], 'y': top['label'].tolist()[::-1], 'type': 'bar', 'orientation': 'h'}],
+                    'layout': {'title': f'{TOP_N} SKU dengan Total Ongkos Terbesar', 'xaxis': {'title': 'Total Ongkos (Rp)'},
+                               'height': 600, 'margin': {'l': 160}}},
+        }
+        summary_html = ''.join(f'<tr><th>{html.escape(name)}</th><td>{html.escape(value)}</td></tr>'
+                               for name, value in _summary_rows(summary))
+        recommendations_html = ''.join(f'<li>{html.escape(text)}</li>' for text in recommendations)
+        self._handle.write(
+            '<!DOCTYPE html>\n<html lang="id"><head><meta charset="utf-8">'
+            '<title>Laporan EOQ Katalog</title>'
+            '<script src="https://cdn.plot.ly/plotly-2.35.2.min.js"></script>'
+            '<style>body{font-family:sans-serif;margin:2rem}table{border-collapse:collapse;font-size:0.85rem}'
+            'th,td{border:1px solid #dee2e6;padding:4px 8px;text-align:right}th{background:#f8f9fa}'
+            '.chart{width:100%;height:450px}</style></head><body>\n'
+            '<h1>📦 Laporan EOQ Katalog</h1>\n'
+            f'<h2>Ringkasan</h2><table>{summary_html}</table>\n'
+            f'<h2>Rekomendasi</h2><ul>{recommendations_html}</ul>\n'
+            '<h2>Grafik</h2><div id="pareto" class="chart"></div><div id="top" class="chart" style="height:600px"></div>\n'
+            f'<script>const charts = {_script_json(charts)};'
+            'for (const [id, fig] of Object.entries(charts)) Plotly.newPlot(id, fig.data, fig.layout);</script>\n'
+            '<h2>Detail per SKU</h2><table>\n')
+
+    def write(self, detail):
+        if self._columns is None:
+            self._columns = list(detail.columns)
+            self._handle.write('<thead><tr>' + ''.join(f'<th>{html.escape(str(col))}</th>' for col in self._columns)
+                               + '</tr></thead><tbody>\n')
+        # Format column by column, then join the cells row by row
+        cells = []
+        for col in self._columns:
+            values = detail[col]
+            if pd.api.types.is_float_dtype(values):
+                cells.append([f'{v:,.2f}' for v in values])
+            else:
+                cells.append([html.escape(str(v)) for v in values])
+        self._handle.write(''.join('<tr><td>' + '</td><td>'.join(row) + '</td></tr>\n' for row in zip(*cells)))
+
+    def close(self):
+        self._handle.write('</tbody></table></body></html>\n')
+        self._handle.close()
+
+
+class ExcelReportWriter:
+    """
+    Workbook with a summary sheet (recommendations and native Excel charts)
+    and detail sheets. xlsxwriter's constant_memory mode flushes each row to
+    disk as soon as the next row starts, so memory stays flat.
+    """
+
+    def __init__(self, path, summary, recommendations):
+        import xlsxwriter  # optional dependency, only needed for Excel reports
+        self._book = xlsxwriter.Workbook(path, {'constant_memory': True, 'nan_inf_to_errors': True})
+        self._bold = self._book.add_format({'bold': True})
+        self._number = self._book.add_format({'num_format': '#,##0.00'})
+        summary_sheet = self._book.add_worksheet('Ringkasan')
+        chart_sheet = self._book.add_worksheet('Data Grafik')
+        self._sheet, self._row, self._n_sheets, self._columns = None, 0, 0, None
+
+        summary_sheet.set_column(0, 0, 36)
+        summary_sheet.set_column(1, 1, 28)
+        summary_sheet.write_row(0, 0, ['Ringkasan Katalog'], self._bold)
+        row = 1
+        for name, value in _summary_rows(summary):
+            summary_sheet.write_row(row, 0, [name, value])
+            row += 1
+        summary_sheet.write_row(row + 1, 0, ['Rekomendasi'], self._bold)
+        for i, text in enumerate(recommendations):
+            summary_sheet.write_row(row + 2 + i, 0, [f'{i + 1}. {text}'])
+        chart_row = row + 3 + len(recommendations)
+
+        # Chart source data lives on its own sheet; rows are written in order
+        share_x, share_y = summary['pareto']
+        top = summary['top']
+        chart_sheet.write_row(0, 0, ['Persentase SKU (%)', 'Kumulatif Total Ongkos (%)', '', 'SKU', 'Total Ongkos (Rp)'], self._bold)
+        for i in range(max(len(share_x), len(top))):
+            values = [float(share_x[i]), float(share_y[i])] if i < len(share_x) else ['', '']
+            if i < len(top):
+                values += ['', str(top['label'].iloc[i]), float(top['OT_optimal'].iloc[i])]
+            chart_sheet.write_row(i + 1, 0, values)
+
+        pareto = self._book.add_chart({'type': 'area'})
+        pareto.add_series({'name': 'Kumulatif Total Ongkos (%)', 'categories': ['Data Grafik', 1, 0, len(share_x), 0],
+                           'values': ['Data Grafik', 1, 1, len(share_x), 1]})
+        pareto.set_title({'name': 'Kurva Pareto Total Ongkos per SKU'})
+        pareto.set_x_axis({'name': 'Persentase SKU (%)', 'interval_unit': 10})
+        pareto.set_legend({'none': True})
+        summary_sheet.insert_chart(chart_row, 0, pareto)
+        if len(top):
+            bars = self._book.add_chart({'type': 'bar'})
+            bars.add_series({'name': 'Total Ongkos (Rp)', 'categories': ['Data Grafik', 1, 3, len(top), 3],
+                             'values': ['Data Grafik', 1, 4, len(top), 4]})
+            bars.set_title({'name': f'{TOP_N} SKU dengan Total Ongkos Terbesar'})
+            bars.set_y_axis({'reverse': True})
+            bars.set_legend({'none': True})
+            bars.set_size({'height': 480})
+            summary_sheet.insert_chart(chart_row + 16, 0, bars)
+
+    def _new_sheet(self):
+        self._n_sheets += 1
+        self._sheet = self._book.add_worksheet('Detail' if self._n_sheets == 1 else f'Detail {self._n_sheets}')
+        self._sheet.set_column(0, len(self._columns) - 1, 14, self._number)
+        self._sheet.set_column(len(self._columns) - 1, len(self._columns) - 1, 70)
+        self._sheet.write_row(0, 0, [str(col) for col in self._columns], self._bold)
+        self._row = 1
+
+    def write(self, detail):
+        if self._columns is None:
+            self._columns = list(detail.columns)
+            self._new_sheet()
+        # astype(object) turns NumPy scalars into Python ones, which xlsxwriter expects
+        for values in detail.astype(object).itertuples(index=False, name=None):
+            if self._row >= MAX_EXCEL_ROWS:
+                self._new_sheet()
+            self._sheet.write_row(self._row, 0, values)
+            self._row += 1
+
+    def close(self):
+        self._book.close()
+
+
+class PDFReportWriter:
+    """
+    Landscape A4 PDF: summary, recommendations and charts on the first page,
+    then a compact detail table. Finished pages are stored compressed, but
+    reportlab keeps them until the file is saved, so PDF suits catalogs
+    that are meant to be printed rather than the very largest ones.
+    """
+    COLUMNS = [('Q_optimal', 'Q*', 60), ('R', 'R', 60), ('T_optimal', 'T (tahun)', 55),
+               ('OT_optimal', 'Total Ongkos (Rp)', 95), ('condition_met', 'Kondisi', 45), ('Rekomendasi', 'Rekomendasi', 0)]
+    ROW_HEIGHT = 11
+
+    def __init__(self, path, summary, recommendations):
+        from reportlab.lib.pagesizes import A4, landscape  # optional dependency, only needed for PDF reports
+        from reportlab.pdfgen import canvas
+        self._canvas = canvas.Canvas(path, pagesize=landscape(A4), pageCompression=1)
+        self._width, self._height = landscape(A4)
+        self._margin = 36
+        self._columns = ([(summary['id_column'], summary['id_column'], 80)] if summary['id_column'] else []) + self.COLUMNS
+        self._y = None
+
+        c = self._canvas
+        y = self._height - self._margin
+        c.setFont('Helvetica-Bold', 16)
+        c.drawString(self._margin, y, 'Laporan EOQ Katalog')
+        y -= 24
+        c.setFont('Helvetica', 9)
+        for name, value in _summary_rows(summary):
+            c.drawString(self._margin, y, _pdf_text(name))
+            c.drawRightString(self._margin + 300, y, _pdf_text(value))
+            y -= 12
+        y -= 8
+        c.setFont('Helvetica-Bold', 11)
+        c.drawString(self._margin, y, 'Rekomendasi')
+        y -= 14
+        c.setFont('Helvetica', 8)
+        for i, text in enumerate(recommendations):
+            c.drawString(self._margin, y, _pdf_text(f'{i + 1}. {text}')[:200])
+            y -= 11
+        self._draw_pareto(summary['pareto'], self._margin, self._margin, 360, y - self._margin - 20)
+        self._draw_top(summary['top'], self._margin + 400, self._margin, self._width - 2 * self._margin - 400,
+                       self._height - 2 * self._margin - 24)
+        c.showPage()
+
+    def _draw_pareto(self, pareto, x0, y0, width, height):
+        c = self._canvas
+        share_x, share_y = pareto
+        c.setFont('Helvetica-Bold', 9)
+        c.drawString(x0, y0 + height + 6, 'Kurva Pareto Total Ongkos per SKU')
+        c.rect(x0, y0, width, height)
+        path = c.beginPath()
+        path.moveTo(x0, y0)
+        for px, py in zip(share_x, share_y):
+            path.lineTo(x0 + px / 100 * width, y0 + py / 100 * height)
+        c.setStrokeColorRGB(0.12, 0.47, 0.71)
+        c.drawPath(path)
+        c.setStrokeColorRGB(0, 0, 0)
+        c.setFont('Helvetica', 7)
+        c.drawString(x0, y0 - 10, '0% SKU')
+        c.drawRightString(x0 + width, y0 - 10, '100% SKU')
+        c.drawRightString(x0 - 2, y0 + height - 7, '100%')
+
+    def _draw_top(self, top, x0, y0, width, height):
+        c = self._canvas
+        c.setFont('Helvetica-Bold', 9)
+        c.drawString(x0, y0 + height + 6, f'{TOP_N} SKU dengan Total Ongkos Terbesar')
+        if not len(top):
+            return
+        bar_height = height / TOP_N
+        largest = max(float(top['OT_optimal'].max()), 1e-9)
+        c.setFont('Helvetica', 6)
+        for i, (label, value) in enumerate(zip(top['label'], top['OT_optimal'])):
+            y = y0 + height - (i + 1) * bar_height
+            c.drawRightString(x0 + 70, y + bar_height / 3, _pdf_text(str(label))[:18])
+            c.setFillColorRGB(0.4, 0.49, 0.92)
+            c.rect(x0 + 74, y + 1, (width - 150) * value / largest, bar_height - 2, stroke=0, fill=1)
+            c.setFillColorRGB(0, 0, 0)
+            c.drawString(x0 + 78 + (width - 150) * value / largest, y + bar_height / 3, f'Rp {value:,.0f}')
+
+    def _start_page(self):
+        c = self._canvas
+        self._y = self._height - self._margin
+        c.setFont('Helvetica-Bold', 7)
+        x = self._margin
+        for _, label, width in self._columns:
+            c.drawString(x, self._y, label)
+            x += width
+        self._y -= self.ROW_HEIGHT
+        c.setFont('Helvetica', 7)
+
+    def write(self, detail):
+        if self._y is None:
+            self._start_page()
+        c = self._canvas
+        cells = [detail[col].tolist() for col, _, _ in self._columns]
+        for row in zip(*cells):
+            if self._y < self._margin:
+                c.showPage()
+                self._start_page()
+            x = self._margin
+            for value, (_, _, width) in zip(row, self._columns):
+                text = f'{value:,.2f}' if isinstance(value, float) else str(value)
+                c.drawString(x, self._y, _pdf_text(text)[:120])
+                x += width
+            self._y -= self.ROW_HEIGHT
+
+    def close(self):
+        self._canvas.showPage()
+        self._canvas.save()
+
+
+def _pdf_text(text):
+    """The standard PDF fonts only cover Latin-1."""
+    return text.replace('≥', '>=').encode('latin-1', 'replace').decode('latin-1')
+
+
+WRITERS = {'html': HTMLReportWriter, 'xlsx': ExcelReportWriter, 'pdf': PDFReportWriter}
+
+
+def export_report(source, path, report_format='html', id_column=None, chunk_rows=DEFAULT_CHUNK_ROWS, progress=None):
+    """
+    Writes the catalog report to `path`. `source` is a result DataFrame or a
+    zero-argument callable returning an iterator of result chunks (e.g.
+    `lambda: iter_eoq_chunks(path)`); it is read twice. Returns `path`.
+    """
+    if report_format not in WRITERS:
+        raise ValueError(f"Format laporan tidak didukung: {report_format}")
+    progress = progress or ExportProgress()
+    chunks = _chunk_factory(source, chunk_rows)
+
+    progress.update(stage='Meringkas katalog', done=0, total=0)
+    summary = summarize_catalog(chunks(), id_column)
+    progress.update(stage='Menulis laporan', total=summary['n_skus'])
+    writer = WRITERS[report_format](path, summary, catalog_recommendations(summary))
+    done = 0
+    try:
+        for chunk in chunks():
+            writer.write(_detail_frame(chunk))
+            done += len(chunk)
+            progress.update(done=done)
+    finally:
+        writer.close()
+    progress.update(stage='Selesai', done=done)
+    return path
+
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def submit_export(source, path, report_format='html', id_column=None, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """
+    Starts `export_report` on a shared background thread pool.
+    Returns (future, progress); the future resolves to `path`.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='eoq-report')
+    progress = ExportProgress()
+    future = _executor.submit(export_report, source, path, report_format, id_column, chunk_rows, progress)
+    return future, progress
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Buat laporan EOQ (HTML/Excel/PDF) untuk seluruh katalog SKU.")
+    parser.add_argument('input', help="File parameter dengan kolom D, C, A, h, L (CSV/JSONL/Parquet)")
+    parser.add_argument('-o', '--output', required=True, help="File laporan (.html, .xlsx, atau .pdf)")
+    parser.add_argument('--format', choices=REPORT_FORMATS, help="Format laporan (default: dari ekstensi file output)")
+    parser.add_argument('--input-format', choices=['csv', 'jsonl', 'parquet'], help="Format input (default: dari ekstensi file)")
+    parser.add_argument('--id-column', help="Kolom identitas SKU yang ikut dicantumkan di laporan")
+    parser.add_argument('--chunksize', type=int, default=DEFAULT_CHUNKSIZE, help=f"Baris per blok (default: {DEFAULT_CHUNKSIZE})")
+    args = parser.parse_args(argv)
+
+    report_format = args.format or os.path.splitext(args.output)[1].lower().lstrip('.')
+    if report_format not in REPORT_FORMATS:
+        print(f"Format laporan tidak dikenali: {report_format} (pilih {', '.join(REPORT_FORMATS)})", file=sys.stderr)
+        return 1
+    from eoq_cli import FORMAT_BY_EXTENSION
+    input_format = args.input_format or FORMAT_BY_EXTENSION.get(os.path.splitext(args.input)[1].lower(), 'csv')
+
+    future, progress = submit_export(lambda: iter_eoq_chunks(args.input, input_format, args.chunksize, args.id_column),
+                                     args.output, report_format, args.id_column)
+    while wait([future], timeout=0.5).not_done:
+        stage, done, total = progress.snapshot()
+        print(f"\r{stage}: {done:,}/{total:,} SKU", end='', file=sys.stderr)
+    try:
+        future.result()
+    except (ValueError, OSError, ImportError) as exc:
+        print(f"\nGagal membuat laporan: {exc}", file=sys.stderr)
+        return 1
+    print(f"\rLaporan ditulis ke {args.output}" + ' ' * 20, file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
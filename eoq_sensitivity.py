@@ -0,0 +1,146 @@
+"""
+Array-based sensitivity analysis for the EOQ model.
+
+Evaluates full parameter grids as broadcast NumPy arrays (one vectorized
+evaluation per grid), plus closed-form partial derivatives and elasticities of Q* and OT*.
+Like eoq_core, this module is UI-free.
+"""
+from functools import lru_cache
+
+import numpy as np
+
+from eoq_core import INPUT_COLUMNS, compute_eoq_arrays
+
+# Relative range used for grids and spider charts (50% to 200% of the base value)
+DEFAULT_SPAN = (0.5, 2.0)
+
+
+def _readonly(arrays):
+    """Marks every array in a dict read-only so cached results stay intact."""
+    for arr in arrays.values():
+        arr.flags.writeable = False
+    return arrays
+
+
+def sensitivity_grid(D, C, A, h, L, axes=('D', 'A', 'h'), n_points=200, span=DEFAULT_SPAN):
+    """
+    Evaluates the EOQ model on a regular grid over the parameters in `axes`,
+    each scaled from span[0] to span[1] times its base value. Axis i of every
+    result array corresponds to axes[i], so a 3-axis call returns arrays of
+    shape (n_points, n_points, n_points).
+    Returns (axis_values, results): dicts of 1-D axis arrays and the Q*/OT*
+    result grids. Grids of up to two axes (the dashboard heatmap) are
+    memoized; 3-axis grids are tens of MB each and are always recomputed.
+    """
+    axes = tuple(axes)
+    if len(axes) <= 2:
+        return _cached_grid(D, C, A, h, L, axes, n_points, span)
+    return _grid(D, C, A, h, L, axes, n_points, span)
+
+
+@lru_cache(maxsize=8)
+def _cached_grid(D, C, A, h, L, axes, n_points, span):
+    return _grid(D, C, A, h, L, axes, n_points, span)
+
+
+def _grid(D, C, A, h, L, axes, n_points, span):
+    unknown = [p for p in axes if p not in INPUT_COLUMNS]
+    if unknown:
+        raise ValueError(f"Parameter sensitivitas tidak dikenal: {', '.join(unknown)}")
+
+    base = {'D': D, 'C': C, 'A': A, 'h': h, 'L': L}
+    factors = np.linspace(span[0], span[1], n_points)
+    axis_values = {}
+    for i, param in enumerate(axes):
+        values = base[param] * factors
+        axis_values[param] = values
+        # Reshape so this axis broadcasts along dimension i only
+        shape = [1] * len(axes)
+        shape[i] = n_points
+        base[param] = values.reshape(shape)
+
+    # Only Q* and OT* are materialized: a 200^3 grid of every metric would
+    # need several hundred MB, while these two use 64 MB each
+    D, C, A, h = base['D'], base['C'], base['A'], base['h']
+    with np.errstate(divide='ignore', invalid='ignore'):
+        valid = (D > 0) & (h > 0)
+        Q_optimal = np.where(valid, np.sqrt((2 * D * A) / h), 0.0)
+        # At the optimum OP* = OS* = Q*h/2, so OT* = DC + Q*h
+        OT_optimal = np.where(valid, D * C + Q_optimal * h, 0.0)
+    # A grid whose axes Q* or OT* do not depend on (C, L) would otherwise keep a length-1
+    # dimension; broadcasting is a view, so the full shape costs no extra memory
+    full_shape = (n_points,) * len(axes)
+    results = {'Q_optimal': np.broadcast_to(Q_optimal, full_shape), 'OT_optimal': np.broadcast_to(OT_optimal, full_shape)}
+    return _readonly(axis_values), _readonly(results)
+
+
+def elasticities(D, C, A, h, L):
+    """
+    Closed-form partial derivatives of Q*, OT* and R with respect to each of
+    the five inputs, and the matching elasticities (x / f) * (df / dx).
+    Works element-wise on arrays. Returns a dict keyed by (metric, param).
+    """
+    D, C, A, h, L = np.broadcast_arrays(*(np.asarray(x, dtype=np.float64) for x in (D, C, A, h, L)))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        Q = np.sqrt((2 * D * A) / h)
+        # At the optimum OP* = OS* = Q*h/2, so OT* = DC + Q*h
+        OT = D * C + Q * h
+        R = D * L
+        zero = np.zeros_like(D)
+        partials = {
+            ('Q_optimal', 'D'): Q / (2 * D),
+            ('Q_optimal', 'C'): zero,
+            ('Q_optimal', 'A'): Q / (2 * A),
+            ('Q_optimal', 'h'): -Q / (2 * h),
+            ('Q_optimal', 'L'): zero,
+            ('OT_optimal', 'D'): C + Q * h / (2 * D),
+            ('OT_optimal', 'C'): D,
+            ('OT_optimal', 'A'): Q * h / (2 * A),
+            ('OT_optimal', 'h'): Q / 2,
+            ('OT_optimal', 'L'): zero,
+            ('R', 'D'): L,
+            ('R', 'C'): zero,
+            ('R', 'A'): zero,
+            ('R', 'h'): zero,
+            ('R', 'L'): D,
+        }
+        values = {'Q_optimal': Q, 'OT_optimal': OT, 'R': R}
+        inputs = {'D': D, 'C': C, 'A': A, 'h': h, 'L': L}
+        result = {}
+        for (metric, param), grad in partials.items():
+            result[(metric, param)] = {
+                'partial': grad,
+                'elasticity': np.where(values[metric] != 0, inputs[param] * grad / values[metric], 0.0),
+            }
+    return result
+
+
+@lru_cache(maxsize=32)
+def spider_curves(D, C, A, h, L, n_points=50, span=DEFAULT_SPAN):
+    """
+    One-at-a-time sensitivity for all five inputs in a single engine call.
+    Row i of every result array varies INPUT_COLUMNS[i] over `span` times its
+    base value while the other inputs stay at their base values.
+    Returns (factors, results) where result arrays have shape (5, n_points).
+    """
+    factors = np.linspace(span[0], span[1], n_points)
+    base = np.array([D, C, A, h, L], dtype=np.float64)
+    # params[j] is the (5, n_points) matrix of values for input j
+    params = np.broadcast_to(base[:, None, None], (5, 5, n_points)).copy()
+    idx = np.arange(5)
+    params[idx, idx, :] = base[:, None] * factors
+    results = compute_eoq_arrays(*params)
+    factors.flags.writeable = False
+    return factors, _readonly(results)
+
+
+def tornado(D, C, A, h, L, swing=0.2, metric='OT_optimal'):
+    """
+    Low/high values of `metric` when each input moves by -swing / +swing,
+    sorted by impact (largest range first), for a tornado chart.
+    Returns a list of (param, low_value, high_value) tuples.
+    """
+    _, results = spider_curves(D, C, A, h, L, n_points=3, span=(1 - swing, 1 + swing))
+    values = results[metric]
+    rows = [(param, float(values[i, 0]), float(values[i, 2])) for i, param in enumerate(INPUT_COLUMNS)]
+    return sorted(rows, key=lambda row: abs(row[2] - row[1]), reverse=True)
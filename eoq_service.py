@@ -0,0 +1,262 @@
+"""
+Asynchronous JSON/HTTP service for the EOQ calculations.
+
+Exposes the same metrics as the dashboard's main tab (Q*, R, T, OB, OP, OS,
+OT, frequency and the L < T condition) over HTTP using only asyncio from the
+standard library. Concurrent requests are micro-batched: they queue for at
+most a couple of milliseconds and are then evaluated together in a single
+vectorized eoq_core call. Responses are cached per parameter set.
+
+Endpoints:
+    GET  /health
+    GET  /eoq?D=1000&C=10000&A=50000&h=2000&L=0.1
+    POST /eoq     body: {"D": ..., "C": ..., "A": ..., "h": ..., "L": ...} or a list of them
+
+Example:
+    python eoq_service.py --port 8080
+"""
+from collections import OrderedDict
+from urllib.parse import parse_qsl, urlsplit
+import argparse
+import asyncio
+import json
+import math
+import sys
+
+import numpy as np
+
+from eoq_core import INPUT_COLUMNS, OUTPUT_COLUMNS, compute_eoq_arrays
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8080
+# Micro-batching window and size
+DEFAULT_MAX_BATCH = 4096
+DEFAULT_MAX_DELAY = 0.002  # seconds
+DEFAULT_CACHE_SIZE = 100_000
+# Largest request body accepted (bytes)
+MAX_BODY_SIZE = 10 * 1024 * 1024
+
+_REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed', 413: 'Payload Too Large'}
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def parse_params(data):
+    """Validates one parameter object and returns the (D, C, A, h, L) tuple of floats."""
+    if not isinstance(data, dict):
+        raise HTTPError(400, "Setiap parameter harus berupa objek JSON")
+    missing = [col for col in INPUT_COLUMNS if col not in data]
+    if missing:
+        raise HTTPError(400, f"Kolom wajib tidak ditemukan: {', '.join(missing)}")
+    try:
+        params = tuple(float(data[col]) for col in INPUT_COLUMNS)
+    except (TypeError, ValueError):
+        raise HTTPError(400, "Nilai parameter harus berupa angka") from None
+    if not all(math.isfinite(value) for value in params):
+        raise HTTPError(400, "Nilai parameter harus berupa angka berhingga")
+    return params
+
+
+class EOQBatcher:
+    """
+    Collects concurrent requests and evaluates them in one vectorized call.
+    Results are kept in a bounded LRU cache keyed on (D, C, A, h, L).
+    """
+
+    def __init__(self, max_batch=DEFAULT_MAX_BATCH, max_delay=DEFAULT_MAX_DELAY, cache_size=DEFAULT_CACHE_SIZE):
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._pending = {}  # params -> future, so identical in-flight requests share one slot
+        self._queue = None
+        self._worker = None
+
+    def start(self):
+        self._queue = asyncio.Queue()
+        self._worker = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+
+    async def compute(self, params):
+        """Returns the result dict for one parameter tuple (cached or batched)."""
+        cached = self._cache.get(params)
+        if cached is not None:
+            self._cache.move_to_end(params)
+            return cached
+        future = self._pending.get(params)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._pending[params] = future
+            self._queue.put_nowait(params)
+        return await asyncio.shield(future)
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_delay
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            # Drain whatever else is already queued without waiting further
+            while len(batch) < self.max_batch and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            try:
+                self._evaluate(batch)
+            except Exception as exc:  # never leave callers waiting on a failed batch
+                for params in batch:
+                    future = self._pending.pop(params, None)
+                    if future is not None and not future.done():
+                        future.set_exception(exc)
+
+    def _evaluate(self, batch):
+        columns = np.array(batch, dtype=np.float64).T
+        results = compute_eoq_arrays(*columns)
+        for i, params in enumerate(batch):
+            result = {col: results[col][i].item() for col in OUTPUT_COLUMNS}
+            self._cache[params] = result
+            future = self._pending.pop(params)
+            if not future.done():
+                future.set_result(result)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+
+class EOQService:
+    """Minimal HTTP/1.1 server (keep-alive, JSON bodies) on top of asyncio streams."""
+
+    def __init__(self, batcher=None):
+        self.batcher = batcher or EOQBatcher()
+        self._server = None
+
+    async def start(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        self.batcher.start()
+        self._server = await asyncio.start_server(self._handle_connection, host, port)
+        return self._server.sockets[0].getsockname()[:2]
+
+    async def serve_forever(self):
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def stop(self):
+        self._server.close()
+        await self._server.wait_closed()
+        await self.batcher.stop()
+
+    async def _handle_connection(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, target, version = request_line.decode('latin-1').split()
+                except ValueError:
+                    await self._respond(writer, 400, {'error': "Request line tidak valid"}, keep_alive=False)
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+                keep_alive = (headers.get('connection', '').lower() != 'close'
+                              and (version == 'HTTP/1.1' or headers.get('connection', '').lower() == 'keep-alive'))
+
+                # Without a valid length the body cannot be framed, so the connection is closed
+                try:
+                    length = int(headers.get('content-length', 0) or 0)
+                except ValueError:
+                    length = -1
+                if length < 0:
+                    await self._respond(writer, 400, {'error': "Content-Length tidak valid"}, keep_alive=False)
+                    break
+                if length > MAX_BODY_SIZE:
+                    await self._respond(writer, 413, {'error': "Body terlalu besar"}, keep_alive=False)
+                    break
+                body = await reader.readexactly(length) if length else b''
+
+                try:
+                    status, payload = 200, await self._dispatch(method, target, body)
+                except HTTPError as exc:
+                    status, payload = exc.status, {'error': str(exc)}
+                await self._respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _dispatch(self, method, target, body):
+        url = urlsplit(target)
+        if url.path == '/health':
+            return {'status': 'ok'}
+        if url.path != '/eoq':
+            raise HTTPError(404, f"Endpoint tidak ditemukan: {url.path}")
+        if method == 'GET':
+            return await self.batcher.compute(parse_params(dict(parse_qsl(url.query))))
+        if method == 'POST':
+            try:
+                data = json.loads(body or b'null')
+            except ValueError:
+                raise HTTPError(400, "Body bukan JSON yang valid") from None
+            if isinstance(data, list):
+                # Validate every item first so a bad one leaves no compute coroutine un-awaited
+                batch = [parse_params(item) for item in data]
+                return list(await asyncio.gather(*(self.batcher.compute(params) for params in batch)))
+            return await self.batcher.compute(parse_params(data))
+        raise HTTPError(405, f"Metode tidak didukung: {method}")
+
+    async def _respond(self, writer, status, payload, keep_alive):
+        body = json.dumps(payload).encode('utf-8')
+        head = (f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+                f"Content-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        writer.write(head.encode('latin-1') + body)
+        await writer.drain()
+
+
+async def serve(host=DEFAULT_HOST, port=DEFAULT_PORT, **batcher_options):
+    service = EOQService(EOQBatcher(**batcher_options))
+    address = await service.start(host, port)
+    print(f"EOQ service berjalan di http://{address[0]}:{address[1]}")
+    await service.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Layanan HTTP/JSON untuk perhitungan EOQ dengan micro-batching.")
+    parser.add_argument('--host', default=DEFAULT_HOST, help=f"Alamat host (default: {DEFAULT_HOST})")
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help=f"Port (default: {DEFAULT_PORT})")
+    parser.add_argument('--max-batch', type=int, default=DEFAULT_MAX_BATCH, help="Permintaan maksimum per batch")
+    parser.add_argument('--max-delay-ms', type=float, default=DEFAULT_MAX_DELAY * 1000, help="Waktu tunggu batch (ms)")
+    parser.add_argument('--cache-size', type=int, default=DEFAULT_CACHE_SIZE, help="Jumlah hasil yang di-cache")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args.host, args.port, max_batch=args.max_batch,
+                          max_delay=args.max_delay_ms / 1000, cache_size=args.cache_size))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,195 @@
+"""
+Monte Carlo simulation of the (Q*, R) policy under stochastic demand.
+
+Daily demand and lead times are drawn from simple distributions and the
+continuous-review policy is replayed day by day. Replications are vectorized
+in NumPy batches (one array row per replication) and batches are spread over
+a process pool. Like eoq_core, this module is UI-free.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from statistics import NormalDist
+import math
+import multiprocessing
+import os
+import threading
+
+import numpy as np
+
+DAYS_PER_YEAR = 365
+DEMAND_DISTRIBUTIONS = ['normal', 'poisson']
+
+# Replications simulated together in one vectorized batch
+DEFAULT_BATCH_SIZE = 10_000
+
+
+def _draw_demand(rng, mean, std, size, demand_dist):
+    """Draws non-negative daily demand from the chosen distribution."""
+    if demand_dist == 'poisson':
+        return rng.poisson(mean, size).astype(np.float64)
+    return np.maximum(rng.normal(mean, std, size), 0.0)
+
+
+def _draw_lead_days(rng, mean, std, size):
+    """Draws lead times in whole days (at least one day)."""
+    if std <= 0:
+        return np.full(size, max(1, round(mean)), dtype=np.int64)
+    return np.maximum(np.rint(rng.normal(mean, std, size)), 1).astype(np.int64)
+
+
+def _simulate_batch(args):
+    """
+    Simulates one batch of replications; runs in a worker process.
+    Returns per-replication arrays (fill rate, stockout-day fraction,
+    average on-hand inventory, number of orders).
+    """
+    (Q, R, demand_mean, demand_std, lead_mean, lead_std,
+     n_reps, n_days, demand_dist, seed) = args
+    rng = np.random.default_rng(seed)
+
+    # Orders can land up to max_lead days after the horizon; size the schedule for that
+    max_lead = int(math.ceil(lead_mean + 6 * lead_std)) + 1
+    arrivals = np.zeros((n_reps, n_days + max_lead + 1))
+    rows = np.arange(n_reps)
+
+    # Start with the inventory position at its maximum (R + Q), nothing on order
+    net = np.full(n_reps, R + Q, dtype=np.float64)
+    on_order = np.zeros(n_reps)
+    total_demand = np.zeros(n_reps)
+    total_served = np.zeros(n_reps)
+    stockout_days = np.zeros(n_reps)
+    on_hand_sum = np.zeros(n_reps)
+    n_orders = np.zeros(n_reps)
+
+    for day in range(n_days):
+        received = arrivals[:, day]
+        net += received
+        on_order -= received
+
+        demand = _draw_demand(rng, demand_mean, demand_std, n_reps, demand_dist)
+        # Unmet demand is backordered, so only positive stock serves today's demand
+        served = np.minimum(demand, np.maximum(net, 0.0))
+        net -= demand
+        total_demand += demand
+        total_served += served
+        stockout_days += served < demand
+        on_hand_sum += np.maximum(net, 0.0)
+
+        # Reorder whenever the inventory position drops to R (several orders if needed)
+        position = net + on_order
+        n_new = np.where(position <= R, np.floor((R - position) / Q) + 1, 0.0)
+        ordering = n_new > 0
+        if ordering.any():
+            lead = _draw_lead_days(rng, lead_mean, lead_std, int(ordering.sum()))
+            arrivals[rows[ordering], np.minimum(day + lead, arrivals.shape[1] - 1)] += n_new[ordering] * Q
+            on_order += n_new * Q
+            n_orders += n_new
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        fill_rate = np.where(total_demand > 0, total_served / total_demand, 1.0)
+    return fill_rate, stockout_days / n_days, on_hand_sum / n_days, n_orders
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def _process_pool(n_workers):
+    """
+    Shared process pool per worker count. Workers are spawned rather than
+    forked (forking the multi-threaded Streamlit server can deadlock the
+    children), and the pool is kept so their start-up cost is paid once.
+    """
+    with _pools_lock:
+        if n_workers not in _pools:
+            _pools[n_workers] = ProcessPoolExecutor(max_workers=n_workers, mp_context=multiprocessing.get_context('spawn'))
+        return _pools[n_workers]
+
+
+def simulate_policy(Q, R, daily_demand_mean, daily_demand_std, lead_time_mean_days, lead_time_std_days=0.0,
+                    n_replications=10_000, n_days=DAYS_PER_YEAR, demand_dist='normal',
+                    batch_size=DEFAULT_BATCH_SIZE, n_workers=None, seed=None):
+    """
+    Replays the (Q, R) policy for `n_replications` independent runs of
+    `n_days` days. Batches go to a process pool when there is more than one
+    batch and more than one worker (n_workers=None uses every CPU).
+    Returns a dict with fill rate, stockout probabilities and inventory stats.
+    """
+    if demand_dist not in DEMAND_DISTRIBUTIONS:
+        raise ValueError(f"Distribusi permintaan tidak dikenal: {demand_dist}")
+    if Q <= 0:
+        raise ValueError("Q harus lebih besar dari 0")
+
+    n_batches = math.ceil(n_replications / batch_size)
+    seeds = np.random.SeedSequence(seed).spawn(n_batches)
+    jobs = [(Q, R, daily_demand_mean, daily_demand_std, lead_time_mean_days, lead_time_std_days,
+             min(batch_size, n_replications - i * batch_size), n_days, demand_dist, seeds[i])
+            for i in range(n_batches)]
+
+    n_workers = min(n_workers or os.cpu_count() or 1, n_batches)
+    if n_workers > 1:
+        pool = _process_pool(n_workers)
+        try:
+            batches = list(pool.map(_simulate_batch, jobs))
+        except BrokenProcessPool:
+            with _pools_lock:
+                _pools.pop(n_workers, None)
+            raise
+    else:
+        batches = [_simulate_batch(job) for job in jobs]
+
+    fill_rate, stockout_days, avg_on_hand, n_orders = (np.concatenate(parts) for parts in zip(*batches))
+    return {
+        'n_replications': n_replications,
+        'fill_rate': float(fill_rate.mean()),
+        'fill_rate_p5': float(np.percentile(fill_rate, 5)),
+        'stockout_day_probability': float(stockout_days.mean()),
+        'stockout_year_probability': float((stockout_days > 0).mean()),
+        'average_on_hand': float(avg_on_hand.mean()),
+        'orders_per_year': float(n_orders.mean() * DAYS_PER_YEAR / n_days),
+    }
+
+
+def lead_time_demand_stats(daily_demand_mean, daily_demand_std, lead_time_mean_days, lead_time_std_days=0.0):
+    """
+    Mean and standard deviation of demand during the lead time, combining
+    demand and lead-time variability: sigma^2 = E[L] sd_d^2 + d^2 sd_L^2.
+    """
+    mean = daily_demand_mean * lead_time_mean_days
+    std = math.sqrt(lead_time_mean_days * daily_demand_std ** 2 + daily_demand_mean ** 2 * lead_time_std_days ** 2)
+    return mean, std
+
+
+def sample_lead_time_demand(daily_demand_mean, daily_demand_std, lead_time_mean_days, lead_time_std_days=0.0,
+                            n_samples=100_000, demand_dist='normal', seed=None):
+    """
+    Draws lead-time demand samples in one vectorized pass: a lead time per
+    sample, then the total demand over that many days from its closed-form
+    conditional distribution.
+    """
+    rng = np.random.default_rng(seed)
+    lead = _draw_lead_days(rng, lead_time_mean_days, lead_time_std_days, n_samples)
+    if demand_dist == 'poisson':
+        return rng.poisson(daily_demand_mean * lead).astype(np.float64)
+    return np.maximum(rng.normal(daily_demand_mean * lead, daily_demand_std * np.sqrt(lead)), 0.0)
+
+
+def safety_stock_for_service_level(target, daily_demand_mean, daily_demand_std, lead_time_mean_days,
+                                   lead_time_std_days=0.0, method='analytic', demand_dist='normal',
+                                   n_samples=100_000, seed=None):
+    """
+    Safety stock needed so that the probability of no stockout during a lead
+    time (cycle service level) equals `target`.
+    'analytic' uses the normal approximation z * sigma_LTD; 'empirical' uses
+    the target quantile of simulated lead-time demand.
+    """
+    if not 0 < target < 1:
+        raise ValueError("Target tingkat layanan harus di antara 0 dan 1")
+    mean, std = lead_time_demand_stats(daily_demand_mean, daily_demand_std, lead_time_mean_days, lead_time_std_days)
+    if method == 'analytic':
+        return max(NormalDist().inv_cdf(target) * std, 0.0)
+    if method == 'empirical':
+        samples = sample_lead_time_demand(daily_demand_mean, daily_demand_std, lead_time_mean_days,
+                                          lead_time_std_days, n_samples, demand_dist, seed)
+        return max(float(np.quantile(samples, target)) - mean, 0.0)
+    raise ValueError(f"Metode safety stock tidak dikenal: {method}")
@@ -0,0 +1,133 @@
+"""
+Persistent scenario store and result cache.
+
+Named scenarios (D, C, A, h, L plus the computed EOQ outputs) are kept in a
+local SQLite database. Results are indexed by a hash of the parameters, so
+computing the same inputs twice is a cache hit, and comparing hundreds of
+saved scenarios is a single query with no recomputation. The number of cached
+results is bounded; the least recently used unnamed entries are evicted first.
+Like eoq_core, this module is UI-free and only needs the standard library
+plus pandas.
+"""
+from time import time
+import hashlib
+import sqlite3
+import struct
+import threading
+
+import pandas as pd
+
+from eoq_core import INPUT_COLUMNS, OUTPUT_COLUMNS, EOQResult, calculate_eoq
+
+DEFAULT_DB_PATH = 'eoq_scenarios.db'
+# Upper bound on cached results (named scenarios are never evicted)
+DEFAULT_MAX_ENTRIES = 10_000
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS results (
+    param_hash TEXT PRIMARY KEY,
+    {', '.join(f'{col} REAL NOT NULL' for col in INPUT_COLUMNS + OUTPUT_COLUMNS)},
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_results_last_used ON results (last_used);
+CREATE TABLE IF NOT EXISTS scenarios (
+    name TEXT PRIMARY KEY,
+    param_hash TEXT NOT NULL REFERENCES results (param_hash),
+    saved_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_scenarios_hash ON scenarios (param_hash);
+"""
+
+
+def param_hash(D, C, A, h, L):
+    """Stable hash of the five input parameters (exact float64 values)."""
+    return hashlib.blake2b(struct.pack('<5d', D, C, A, h, L), digest_size=16).hexdigest()
+
+
+class ScenarioStore:
+    """SQLite-backed scenario store with a bounded, hash-indexed result cache."""
+
+    def __init__(self, path=DEFAULT_DB_PATH, max_entries=DEFAULT_MAX_ENTRIES):
+        self.path = path
+        self.max_entries = max_entries
+        # Streamlit sessions run on different threads and share this store, so the
+        # connection is shared too and every transaction is serialized by the lock
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.RLock()
+        with self._lock:
+            # WAL without a sync on every commit keeps saves and cache hits (which touch last_used) cheap
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+
+    def get_or_compute(self, D, C, A, h, L):
+        """Returns the cached EOQResult for these inputs, computing and storing it on a miss."""
+        key = param_hash(D, C, A, h, L)
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                f"SELECT {', '.join(OUTPUT_COLUMNS)} FROM results WHERE param_hash = ?", (key,)).fetchone()
+            if row is not None:
+                self._conn.execute("UPDATE results SET last_used = ? WHERE param_hash = ?", (time(), key))
+                result = EOQResult(*row)
+                return result._replace(condition_met=bool(result.condition_met))
+
+            result = calculate_eoq(D, C, A, h, L)
+            columns = ['param_hash'] + INPUT_COLUMNS + OUTPUT_COLUMNS + ['last_used']
+            self._conn.execute(
+                f"INSERT INTO results ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+                (key, D, C, A, h, L, *(float(v) for v in result), time()))
+            self._evict()
+        return result
+
+    def save_scenario(self, name, D, C, A, h, L):
+        """Saves (or overwrites) a named scenario and returns its EOQResult."""
+        result = self.get_or_compute(D, C, A, h, L)
+        with self._lock, self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO scenarios (name, param_hash, saved_at) VALUES (?, ?, ?)",
+                               (name, param_hash(D, C, A, h, L), time()))
+        return result
+
+    def delete_scenario(self, name):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM scenarios WHERE name = ?", (name,))
+
+    def list_scenarios(self):
+        """Names of all saved scenarios, most recently saved first."""
+        with self._lock:
+            return [row[0] for row in self._conn.execute("SELECT name FROM scenarios ORDER BY saved_at DESC")]
+
+    def load_scenarios(self, names=None):
+        """
+        Loads saved scenarios with their stored inputs and outputs in one
+        query (no recomputation). Returns a DataFrame indexed by name.
+        """
+        columns = ', '.join(f'r.{col}' for col in INPUT_COLUMNS + OUTPUT_COLUMNS)
+        query = f"SELECT s.name, {columns} FROM scenarios s JOIN results r ON r.param_hash = s.param_hash"
+        params = ()
+        if names is not None:
+            if not names:
+                return pd.DataFrame(columns=INPUT_COLUMNS + OUTPUT_COLUMNS).rename_axis('name')
+            query += f" WHERE s.name IN ({', '.join('?' * len(names))})"
+            params = tuple(names)
+        with self._lock:
+            df = pd.read_sql_query(query + " ORDER BY s.saved_at DESC", self._conn, params=params, index_col='name')
+        df['condition_met'] = df['condition_met'].astype(bool)
+        return df
+
+    def cache_size(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def _evict(self):
+        """Drops the least recently used results beyond max_entries, keeping named scenarios."""
+        excess = self.cache_size() - self.max_entries
+        if excess > 0:
+            self._conn.execute(
+                """DELETE FROM results WHERE param_hash IN (
+                       SELECT param_hash FROM results
+                       WHERE param_hash NOT IN (SELECT param_hash FROM scenarios)
+                       ORDER BY last_used LIMIT ?)""", (excess,))
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,32 @@
+"""
+Lightweight wall-clock timing for dashboard sections and benchmarks.
+
+Only uses the standard library so it can be imported by the dashboard, the
+benchmark harness and batch jobs alike.
+"""
+from contextlib import contextmanager
+from time import perf_counter
+
+
+class SectionTimer:
+    """Accumulates elapsed seconds per named section of a run."""
+
+    def __init__(self):
+        self.timings = {}
+        self._started = perf_counter()
+
+    @contextmanager
+    def section(self, name):
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = self.timings.get(name, 0.0) + perf_counter() - start
+
+    def total(self):
+        """Seconds since the timer was created."""
+        return perf_counter() - self._started
+
+    def as_dict(self):
+        """Timings in milliseconds, in the order the sections first ran."""
+        return {name: seconds * 1000 for name, seconds in self.timings.items()}
@@ -0,0 +1,35 @@
+import pandas as pd
+import pytest
+
+from eoq_cli import main
+
+pytest.importorskip('pyarrow')
+
+PARAMETERS = pd.DataFrame({'sku': ['1001', 'A-17', '007'], 'D': [1000, 500.5, 800], 'C': [10, 20, 30],
+                           'A': [50, 80, 60], 'h': [2, 4, 3], 'L': [0.1, 0.2, 0.05]})
+
+
+@pytest.mark.parametrize('input_name', ['params.csv', 'params.jsonl', 'params.parquet'])
+def test_round_trip_to_parquet_with_mixed_ids(tmp_path, input_name):
+    # Numeric-looking ids in one chunk and text ids in the next used to break the Parquet schema
+    source = tmp_path / input_name
+    if input_name.endswith('.csv'):
+        PARAMETERS.to_csv(source, index=False)
+    elif input_name.endswith('.jsonl'):
+        PARAMETERS.assign(sku=[1001, 'A-17', '007']).to_json(source, orient='records', lines=True)
+    else:
+        PARAMETERS.to_parquet(source, index=False)
+    output = tmp_path / 'results.parquet'
+    assert main([str(source), '-o', str(output), '--id-column', 'sku', '--chunksize', '1']) == 0
+    results = pd.read_parquet(output)
+    assert list(results['sku']) == list(PARAMETERS['sku'])
+    assert results['Q_optimal'].to_numpy() == pytest.approx(((2 * PARAMETERS['D'] * PARAMETERS['A'] / PARAMETERS['h']) ** 0.5).to_numpy())
+    assert not (tmp_path / 'results.parquet.part').exists()
+
+
+def test_failed_run_leaves_no_partial_output(tmp_path):
+    source = tmp_path / 'params.csv'
+    source.write_text('D,C,A,h,L\n1000,10,50,2,0.1\n1000,10,50,abc,0.1\n')
+    output = tmp_path / 'results.csv'
+    assert main([str(source), '-o', str(output), '--chunksize', '1']) == 1
+    assert list(tmp_path.iterdir()) == [source]
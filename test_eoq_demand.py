@@ -0,0 +1,40 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from eoq_demand import rolling_annual_demand, update_eoq, window_demand_stats
+
+PARAMS = {'C': 10.0, 'A': 50.0, 'h': 2.0, 'L': 0.05}
+
+
+def _daily(days, skus=('A', 'B'), qty=10.0):
+    dates = pd.date_range('2024-01-01', periods=days)
+    return pd.DataFrame({'sku': np.repeat(list(skus), days), 'date': np.tile(dates, len(skus)), 'qty': qty})
+
+
+def test_short_history_is_annualized_over_covered_days():
+    # 90 days of 10 units/day inside a 365-day window used to give D = 900 instead of 3650
+    daily = _daily(90, skus=('A',))
+    stats = window_demand_stats(daily, window_days=365)
+    assert stats.loc['A', 'D'] == pytest.approx(3650.0)
+    assert stats.loc['A', 'demand_std_daily'] == pytest.approx(0.0)
+    assert stats.loc['A', 'D'] == pytest.approx(rolling_annual_demand(daily, 'A', window_days=365)['D'].iloc[-1])
+
+
+def test_new_day_recomputes_only_the_skus_that_changed():
+    daily = _daily(400)
+    # B only sold mid-history, so moving the window by one day leaves its sums unchanged
+    daily = daily[(daily['sku'] == 'A') | daily['date'].between('2024-04-01', '2024-10-01')]
+    results, _ = update_eoq(window_demand_stats(daily), PARAMS)
+    next_day = pd.DataFrame({'sku': ['A'], 'date': [daily['date'].max() + pd.Timedelta(days=1)], 'qty': [25.0]})
+    _, changed = update_eoq(window_demand_stats(pd.concat([daily, next_day], ignore_index=True)), PARAMS, results)
+    assert list(changed) == ['A']
+
+
+def test_window_length_change_recomputes_every_sku():
+    daily = _daily(400, qty=np.arange(800, dtype=np.float64) % 7)
+    results, _ = update_eoq(window_demand_stats(daily, window_days=365), PARAMS)
+    updated, changed = update_eoq(window_demand_stats(daily, window_days=180), PARAMS, results)
+    fresh, _ = update_eoq(window_demand_stats(daily, window_days=180), PARAMS)
+    assert sorted(changed) == ['A', 'B']
+    np.testing.assert_allclose(updated['Q_optimal'], fresh['Q_optimal'])
@@ -0,0 +1,27 @@
+import numpy as np
+import pytest
+
+from eoq_optimizer import constrained_eoq
+
+
+def test_constrained_eoq_skips_invalid_rows():
+    # Blank/NaN inputs and a row with h = 0 and zero budget usage (C = 0) used to hang the bracket search
+    D = np.array([1000.0, np.nan, 500.0, 800.0])
+    A = np.array([50.0, 50.0, 50.0, 50.0])
+    h = np.array([2.0, 2.0, 0.0, 2.0])
+    usage = np.array([[10.0, 10.0, 0.0, np.nan]])
+    Q, lam = constrained_eoq(D, A, h, usage, [1000.0])
+    assert Q[1] == Q[2] == Q[3] == 0.0
+    assert Q[0] > 0 and usage[0, 0] * Q[0] <= 1000.0 * (1 + 1e-6)
+    assert lam[0] > 0
+
+
+def test_constrained_eoq_matches_eoq_when_limit_is_slack():
+    Q, lam = constrained_eoq([1000.0], [50.0], [2.0], [[1.0]], [1e9])
+    assert Q[0] == pytest.approx(np.sqrt(2 * 1000 * 50 / 2))
+    assert lam[0] == 0.0
+
+
+def test_constrained_eoq_rejects_unreachable_limit():
+    with pytest.raises(ValueError):
+        constrained_eoq([1e10], [1e10], [1.0], [[1.0]], [1e-6], max_doublings=5)
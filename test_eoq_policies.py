@@ -0,0 +1,32 @@
+import warnings
+
+import numpy as np
+import pytest
+
+from eoq_core import compute_eoq_arrays
+from eoq_policies import POLICIES, ContinuousReview, ProductionEPQ
+
+
+def test_epq_finds_optimum_when_production_rate_is_close_to_demand():
+    # The optimum EOQ / sqrt(1 - D/p) used to be cut off at the 10x EOQ search bound
+    D, A, h, p = 1000.0, 50000.0, 2000.0, 1000.5
+    result = ProductionEPQ().optimize({'D': D, 'C': 10.0, 'A': A, 'h': h, 'L': 0.1, 'production_rate': p})
+    assert result['Q'] == pytest.approx(np.sqrt(2 * D * A / h) / np.sqrt(1 - D / p), rel=1e-5)
+
+
+def test_continuous_review_matches_eoq_core():
+    D, C, A, h, L = np.array([1000.0, 500.0]), np.array([10.0, 20.0]), np.array([50.0, 80.0]), np.array([2.0, 4.0]), np.array([0.1, 0.2])
+    result = ContinuousReview().optimize({'D': D, 'C': C, 'A': A, 'h': h, 'L': L})
+    np.testing.assert_allclose(result['Q'], compute_eoq_arrays(D, C, A, h, L)['Q_optimal'], rtol=1e-5)
+
+
+@pytest.mark.parametrize('policy', POLICIES, ids=lambda policy: policy.name)
+def test_invalid_rows_give_zeros_without_warnings(policy):
+    params = {'D': np.array([1000.0, 0.0, -5.0, 1000.0, np.nan]), 'C': 10.0, 'A': 50.0,
+              'h': np.array([2.0, 2.0, 2.0, 0.0, 2.0]), 'L': 0.1, 'sigma': 50.0, 'production_rate': 5000.0}
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        result = policy.optimize(params)
+    for value in result.values():
+        assert np.all(value[1:] == 0.0)
+        assert np.all(np.isfinite(value[:1])) and value[0] > 0
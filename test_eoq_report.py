@@ -0,0 +1,15 @@
+import pandas as pd
+
+from eoq_core import compute_eoq_frame
+from eoq_report import export_report
+
+
+def test_html_report_escapes_sku_labels_in_chart_script(tmp_path):
+    # The top-SKU chart labels are inlined as JSON in a <script> block
+    evil = '</script><script>alert(1)</script>'
+    frame = compute_eoq_frame(pd.DataFrame({'sku': [evil, 'B-2'], 'D': [1000.0, 500.0], 'C': [10.0, 10.0],
+                                            'A': [50.0, 50.0], 'h': [2.0, 2.0], 'L': [0.1, 0.1]}))
+    path = export_report(frame, str(tmp_path / 'report.html'), 'html', id_column='sku')
+    page = open(path, encoding='utf-8').read()
+    assert evil not in page
+    assert page.count('<script') == 2
@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+
+from eoq_core import calculate_eoq
+from eoq_sensitivity import _cached_grid, sensitivity_grid
+
+BASE = (1000.0, 10000.0, 50000.0, 2000.0, 0.1)
+
+
+@pytest.mark.parametrize('axes', [('A', 'C'), ('C', 'D'), ('L', 'h'), ('C', 'L'), ('D', 'A', 'h'), ('C', 'D', 'L')])
+def test_grid_results_have_the_full_shape(axes):
+    # Axes Q* or OT* do not depend on (C, L) used to leave length-1 dimensions in the result
+    axis_values, results = sensitivity_grid(*BASE, axes=axes, n_points=7)
+    assert set(axis_values) == set(axes)
+    for grid in results.values():
+        assert grid.shape == (7,) * len(axes)
+        assert not grid.flags.writeable
+
+
+def test_grid_matches_scalar_model():
+    axis_values, results = sensitivity_grid(*BASE, axes=('A', 'C'), n_points=5)
+    D, _, _, h, L = BASE
+    for i, A in enumerate(axis_values['A']):
+        for j, C in enumerate(axis_values['C']):
+            expected = calculate_eoq(D, C, A, h, L)
+            assert results['Q_optimal'][i, j] == pytest.approx(expected.Q_optimal)
+            assert results['OT_optimal'][i, j] == pytest.approx(expected.OT_optimal)
+
+
+def test_three_axis_grids_are_not_cached():
+    _cached_grid.cache_clear()
+    sensitivity_grid(*BASE, axes=('D', 'A', 'h'), n_points=4)
+    sensitivity_grid(*BASE, axes=('D', 'A'), n_points=4)
+    assert _cached_grid.cache_info().currsize == 1